@@ -4,6 +4,9 @@ Logs de exemplo para testar o Bug Finder.
 Use estes logs na interface web ou CLI para ver o sistema funcionando.
 """
 
+import sys
+from types import MappingProxyType
+
 # Log 1: Erro crítico de banco de dados
 DATABASE_ERROR = """
 ERROR 2024-01-20 10:30:45 - app.py:142 - Database connection failed
@@ -96,8 +99,8 @@ Service: DataSyncService
 Last successful sync: 2024-01-20 15:30:00
 """
 
-# Dicionário com todos os logs para fácil acesso
-SAMPLE_LOGS = {
+# Dicionário com todos os logs para fácil acesso (somente leitura)
+SAMPLE_LOGS = MappingProxyType({
     "database_error": DATABASE_ERROR,
     "auth_error": AUTH_ERROR, 
     "api_error": API_ERROR,
@@ -106,15 +109,15 @@ SAMPLE_LOGS = {
     "system_error": SYSTEM_ERROR,
     "info_log": INFO_LOG,
     "network_error": NETWORK_ERROR
-}
+})
 
 def print_all_logs():
     """Imprime todos os logs de exemplo."""
-    for name, log in SAMPLE_LOGS.items():
-        print(f"\n{'='*50}")
-        print(f"LOG: {name.upper()}")
-        print('='*50)
-        print(log.strip())
+    separator = '=' * 50
+    sys.stdout.write(''.join(
+        f"\n{separator}\nLOG: {name.upper()}\n{separator}\n{log.strip()}\n"
+        for name, log in SAMPLE_LOGS.items()
+    ))
 
 def get_log(name: str) -> str:
     """Retorna um log específico pelo nome."""
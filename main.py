@@ -11,53 +11,59 @@ Use os comandos do ADK para executar:
 
 import os
 import sys
+import atexit
 import logging
-from pathlib import Path
-
-# Adicionar src ao path para imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from src.config import get_settings
-from src.agents import BugFinderSystem, create_agent
 
 
-def setup_logging():
+def setup_logging(settings):
     """Configura o sistema de logging."""
-    settings = get_settings()
-    
     # Configurar formato de log
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
     # Configurar nível
     log_level = getattr(logging, settings.log_level.value)
     
-    # Configurar logging
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Assim como basicConfig, não reconfigura se já houver handlers
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    handlers = [logging.StreamHandler(sys.stdout)]
     
     # Adicionar handler de arquivo se especificado
     if settings.log_file_path:
-        file_handler = logging.FileHandler(settings.log_file_path)
-        file_handler.setFormatter(logging.Formatter(log_format))
-        logging.getLogger().addHandler(file_handler)
+        handlers.append(logging.FileHandler(settings.log_file_path))
+    
+    formatter = logging.Formatter(log_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Quem loga apenas enfileira o registro; a escrita em stdout/arquivo
+    # acontece na thread do QueueListener
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(QueueHandler(log_queue))
 
 
-def validate_environment():
+def validate_environment(settings):
     """Valida se o ambiente está configurado corretamente."""
-    settings = get_settings()
     errors = settings.validate_required_settings()
     
     if errors:
-        print("❌ Configuração inválida:")
-        for error in errors:
-            print(f"  - {error}")
-        print("\n💡 Verifique o arquivo .env e configure as variáveis necessárias.")
-        print("   Use .env.example como referência.")
+        error_lines = "".join(f"  - {error}\n" for error in errors)
+        sys.stdout.write(
+            f"❌ Configuração inválida:\n{error_lines}"
+            "\n💡 Verifique o arquivo .env e configure as variáveis necessárias.\n"
+            "   Use .env.example como referência.\n"
+        )
         return False
     
     return True
@@ -67,16 +73,19 @@ def main():
     """Função principal do sistema Bug Finder."""
     print("🐛 Bug Finder System - Inicializando...")
     
+    settings = get_settings()
+    
     # Configurar logging
-    setup_logging()
+    setup_logging(settings)
     logger = logging.getLogger(__name__)
     
     try:
         # Validar ambiente
-        if not validate_environment():
+        if not validate_environment(settings):
             sys.exit(1)
         
-        # Criar sistema Bug Finder
+        # Criar sistema Bug Finder (import tardio: carrega ADK, Gemini e GitHub só aqui)
+        from src.agents import BugFinderSystem
         bug_finder = BugFinderSystem()
         
         # Testar integrações na inicialização
@@ -88,18 +97,22 @@ def main():
         
         if failed_tests:
             logger.warning(f"Some integrations failed: {', '.join(failed_tests)}")
-            print(f"⚠️  Algumas integrações falharam: {', '.join(failed_tests)}")
-            print("   O sistema pode funcionar com funcionalidade limitada.")
+            sys.stdout.write(
+                f"⚠️  Algumas integrações falharam: {', '.join(failed_tests)}\n"
+                "   O sistema pode funcionar com funcionalidade limitada.\n"
+            )
         else:
             logger.info("All integrations working correctly")
             print("✅ Todas as integrações funcionando corretamente!")
         
         # Mostrar status do sistema
         status = bug_finder.get_system_status()
-        print(f"\n📊 Sistema Bug Finder {status['system_info']['version']} iniciado")
-        print(f"🏗️  Ambiente: {status['system_info']['environment']}")
-        print(f"🔗 GitHub: {status['integrations']['github']['repository']}")
-        print(f"🤖 Modelo AI: {status['integrations']['ai']['model']}")
+        sys.stdout.write(
+            f"\n📊 Sistema Bug Finder {status['system_info']['version']} iniciado\n"
+            f"🏗️  Ambiente: {status['system_info']['environment']}\n"
+            f"🔗 GitHub: {status['integrations']['github']['repository']}\n"
+            f"🤖 Modelo AI: {status['integrations']['ai']['model']}\n"
+        )
         
         return bug_finder
         
@@ -117,9 +130,11 @@ def create_agent():
 
 if __name__ == "__main__":
     # Modo standalone - não ADK
-    print("🚀 Executando Bug Finder em modo standalone...")
-    print("💡 Para usar a interface web ADK, execute: adk ui main")
-    print("💡 Para usar o CLI ADK, execute: adk run main")
+    sys.stdout.write(
+        "🚀 Executando Bug Finder em modo standalone...\n"
+        "💡 Para usar a interface web ADK, execute: adk ui main\n"
+        "💡 Para usar o CLI ADK, execute: adk run main\n"
+    )
     
     bug_finder = main()
     
@@ -137,11 +152,13 @@ if __name__ == "__main__":
     
     if result["status"] == "success":
         analysis = result["analysis"]
-        print(f"✅ Log analisado:")
-        print(f"   - É bug: {analysis['is_bug']}")
-        print(f"   - Severidade: {analysis['severity']}")
-        print(f"   - Categoria: {analysis['category']}")
-        print(f"   - Confiança: {analysis['confidence']:.2f}")
-        print(f"   - Decisão: {analysis['decision']}")
+        sys.stdout.write(
+            "✅ Log analisado:\n"
+            f"   - É bug: {analysis['is_bug']}\n"
+            f"   - Severidade: {analysis['severity']}\n"
+            f"   - Categoria: {analysis['category']}\n"
+            f"   - Confiança: {analysis['confidence']:.2f}\n"
+            f"   - Decisão: {analysis['decision']}\n"
+        )
     else:
         print(f"❌ Erro na análise: {result['message']}")
\ No newline at end of file
@@ -1,12 +1,34 @@
-from .bug_analyser_agent import BugAnalyserAgent
-from .issue_manager_agent import IssueManagerAgent
-from .notification_agent import NotificationAgent
-from .bug_finder_system import BugFinderSystem, create_agent
+import importlib
+
+# Os agentes são importados sob demanda (PEP 562): cada módulo puxa google-genai,
+# google-adk e os clientes de GitHub/Discord, então quem usa só um agente
+# não paga o import dos demais.
+_LAZY_IMPORTS = {
+    "BugAnalyserAgent": ".bug_analyser_agent",
+    "IssueManagerAgent": ".issue_manager_agent",
+    "NotificationAgent": ".notification_agent",
+    "BugFinderSystem": ".bug_finder_system",
+    "create_agent": ".bug_finder_system",
+}
 
 __all__ = [
     "BugAnalyserAgent",
-    "IssueManagerAgent", 
+    "IssueManagerAgent",
     "NotificationAgent",
     "BugFinderSystem",
     "create_agent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # próximos acessos não passam mais por __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,16 +1,85 @@
-import json
+import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from uuid import uuid4
 
-import google.generativeai as genai
+import httpx
+from google.genai import errors as genai_errors
+from google.genai import types
+from pydantic_core import to_json
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from ..models import (
     LogModel, ProcessedLog, BugAnalysis, AnalysisResult, 
-    BugSeverity, BugCategory, BugImpact, AnalysisDecision, LogLevel
+    BugSeverity, BugCategory, BugImpact, AnalysisDecision, LogLevel,
+    TIMESTAMP_RE
 )
-from ..config import get_settings, get_prompt
+from ..config import get_settings, get_prompt, get_genai_client, truncate_for_prompt, MAX_PROMPT_INPUT_CHARS
+from ..cache import get_analysis_cache
+from .response_utils import enum_from_response, load_response_json
+
+# Status HTTP transitórios da API (rate limit / indisponível / timeout) que justificam nova tentativa
+_RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+
+# Timeouts do próprio cliente (HttpOptions.timeout): httpx no transporte padrão;
+# aiohttp/asyncio sinalizam com TimeoutError no cliente assíncrono
+_RETRYABLE_TIMEOUT_ERRORS = (httpx.TimeoutException, TimeoutError)
+
+_FALLBACK_ANALYSIS_NOTES = "Analysis failed, created fallback"
+
+# Batch API: estados finais do job e intervalo de polling (backoff exponencial)
+_BATCH_COMPLETED_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"
+})
+_BATCH_POLL_INITIAL_SECONDS = 10
+_BATCH_POLL_MAX_SECONDS = 300
+
+# Valores aceitos na resposta da IA -> membros dos enums, montados uma única vez
+_LOG_LEVEL_VALUES = frozenset(member.value for member in LogLevel)
+_SEVERITY_BY_VALUE = {member.value: member for member in BugSeverity}
+_CATEGORY_BY_VALUE = {member.value: member for member in BugCategory}
+_IMPACT_BY_VALUE = {member.value: member for member in BugImpact}
+_DECISION_BY_VALUE = {member.value: member for member in AnalysisDecision}
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milissegundos decorridos desde start_ns (relógio monotônico de time.perf_counter_ns)."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+def _timestamp_from_text(raw_log: str) -> datetime:
+    """Primeiro timestamp ISO encontrado no log, ou o horário atual."""
+    match = TIMESTAMP_RE.search(raw_log)
+    if match:
+        try:
+            return datetime.fromisoformat(match.group())
+        except ValueError:
+            pass
+    return datetime.now()
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    if isinstance(error, _RETRYABLE_TIMEOUT_ERRORS):
+        return True
+    return isinstance(error, genai_errors.APIError) and error.code in _RETRYABLE_STATUS_CODES
+
+
+def _results_in_input_order(raw_logs: List[str], results_by_log: Dict[str, AnalysisResult]) -> List[AnalysisResult]:
+    """Remonta os resultados de logs únicos na ordem de entrada, copiando os repetidos."""
+    results = []
+    seen = set()
+    for raw_log in raw_logs:
+        result = results_by_log[raw_log]
+        if raw_log in seen:
+            # Cada ocorrência recebe sua própria cópia e um novo log_id
+            result = result.model_copy(deep=True)
+            result.analysis.log_id = uuid4().hex
+        else:
+            seen.add(raw_log)
+        results.append(result)
+    return results
 
 
 class BugAnalyserAgent:
@@ -22,76 +91,363 @@ class BugAnalyserAgent:
         if not self.settings.google_ai_api_key:
             raise ValueError("GOOGLE_AI_API_KEY is required but not found in environment")
         
-        # Configure Google AI with explicit API key
-        genai.configure(api_key=self.settings.google_ai_api_key)
-        self.model = genai.GenerativeModel(self.settings.gemini_model)
-        
         # Generation config
-        self.generation_config = {
-            "temperature": self.settings.gemini_temperature,
-            "max_output_tokens": self.settings.gemini_max_tokens,
-        }
+        self.generation_config = types.GenerateContentConfig(
+            temperature=self.settings.gemini_temperature,
+            max_output_tokens=self.settings.gemini_max_tokens,
+        )
+    
+    @property
+    def client(self):
+        """Cliente Google AI compartilhado; buscado a cada uso para acompanhar reload_settings()."""
+        return get_genai_client()
     
-    def process_and_analyze_log(self, raw_log: str) -> AnalysisResult:
+    @property
+    def analysis_cache(self):
+        """Cache de análises para logs repetidos; buscado a cada uso, pois reload_settings() o substitui."""
+        return get_analysis_cache() if get_settings().enable_analysis_cache else None
+    
+    def process_and_analyze_log(self, raw_log: str, use_cache: bool = True) -> AnalysisResult:
         """
         Processa o log bruto e realiza análise completa para determinar se é um bug.
         Combina as funcionalidades de LogReceiver + BugAnalyser em um só agente.
+        Com use_cache=False a IA é sempre chamada e o resultado não vai para o cache.
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
+        
+        cached = self._get_cached_result(raw_log, start_ns) if use_cache else None
+        if cached is not None:
+            return cached
         
         try:
             self.logger.info("Starting log processing and analysis")
             
-            # Etapa 1: Processar log bruto
-            processed_log = self._process_raw_log(raw_log)
+            # Etapa 1: Processar log bruto (e, no modo combinado, já analisá-lo na mesma chamada)
+            if self.settings.enable_fused_analysis:
+                processed_log, bug_analysis = self._process_and_analyze_fused(raw_log)
+            else:
+                processed_log, bug_analysis = self._process_raw_log(raw_log), None
             
             if not processed_log.is_valid:
                 self.logger.warning("Log processing failed, creating minimal analysis")
-                return self._create_failed_analysis(raw_log, processed_log, start_time)
+                return self._create_failed_analysis(raw_log, processed_log, start_ns)
             
             # Etapa 2: Analisar se é bug
-            bug_analysis = self._analyze_bug(processed_log)
+            if bug_analysis is None:
+                bug_analysis = self._analyze_bug(processed_log)
             
-            # Criar resultado final
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            return self._create_result(raw_log, processed_log, bug_analysis, start_ns, use_cache)
             
-            result = AnalysisResult(
-                log=processed_log.parsed_log,
-                analysis=bug_analysis,
-                processing_time_ms=processing_time,
-                analyzer_version="1.0.0"
-            )
+        except Exception as e:
+            self.logger.error("Error in log analysis: %s", e)
+            return self._create_error_analysis(raw_log, str(e), start_ns)
+    
+    async def process_and_analyze_logs_async(self, raw_logs: List[str]) -> List[AnalysisResult]:
+        """
+        Processa e analisa vários logs concorrentemente.
+        O número de logs em análise simultânea é limitado por AI_MAX_CONCURRENCY;
+        logs idênticos no mesmo lote são analisados uma única vez e os resultados
+        mantêm a ordem de entrada.
+        """
+        semaphore = asyncio.Semaphore(self.settings.ai_max_concurrency)
+        
+        async def analyze(raw_log: str) -> AnalysisResult:
+            async with semaphore:
+                return await self._process_and_analyze_log_async(raw_log)
+        
+        # Duplicatas rodariam em paralelo antes de o cache ser preenchido
+        unique_logs = list(dict.fromkeys(raw_logs))
+        analyzed = await asyncio.gather(*(analyze(raw_log) for raw_log in unique_logs))
+        
+        return _results_in_input_order(raw_logs, dict(zip(unique_logs, analyzed)))
+    
+    async def process_and_analyze_logs_batch(self, raw_logs: List[str]) -> List[AnalysisResult]:
+        """
+        Analisa vários logs via Batch API do Gemini: custo menor, mas o job pode
+        levar de minutos a horas. Indicado para triagem offline/noturna.
+        Usa sempre o prompt log_analyser; logs em cache não são reenviados e
+        respostas inutilizáveis seguem pelo fluxo online. Mantém a ordem de entrada.
+        """
+        start_ns = time.perf_counter_ns()
+        
+        unique_logs = list(dict.fromkeys(raw_logs))
+        results_by_log: Dict[str, AnalysisResult] = {}
+        pending = []
+        for raw_log in unique_logs:
+            cached = self._get_cached_result(raw_log, start_ns)
+            if cached is None:
+                pending.append(raw_log)
+            else:
+                results_by_log[raw_log] = cached
+        
+        if pending:
+            results_by_log.update(await self._run_batch_job(pending, start_ns))
+        
+        return _results_in_input_order(raw_logs, results_by_log)
+    
+    async def _process_and_analyze_log_async(self, raw_log: str) -> AnalysisResult:
+        """Versão assíncrona de process_and_analyze_log."""
+        start_ns = time.perf_counter_ns()
+        
+        cached = self._get_cached_result(raw_log, start_ns)
+        if cached is not None:
+            return cached
+        
+        try:
+            if self.settings.enable_fused_analysis:
+                processed_log, bug_analysis = await self._process_and_analyze_fused_async(raw_log)
+            else:
+                processed_log, bug_analysis = await self._process_raw_log_async(raw_log), None
             
-            self.logger.info(f"Analysis completed - Bug: {bug_analysis.is_bug}, "
-                           f"Severity: {bug_analysis.severity}, Decision: {bug_analysis.decision}")
+            return await self._finish_analysis_async(raw_log, processed_log, bug_analysis, start_ns)
             
-            return result
+        except Exception as e:
+            self.logger.error("Error in log analysis: %s", e)
+            return self._create_error_analysis(raw_log, str(e), start_ns)
+    
+    async def _finish_analysis_async(self, raw_log: str, processed_log: ProcessedLog,
+                                     bug_analysis: Optional[BugAnalysis], start_ns: int) -> AnalysisResult:
+        """Completa a análise (etapa de bug, se ainda faltar) e monta o resultado."""
+        if not processed_log.is_valid:
+            self.logger.warning("Log processing failed, creating minimal analysis")
+            return self._create_failed_analysis(raw_log, processed_log, start_ns)
+        
+        if bug_analysis is None:
+            bug_analysis = await self._analyze_bug_async(processed_log)
+        
+        return self._create_result(raw_log, processed_log, bug_analysis, start_ns)
+    
+    async def _run_batch_job(self, raw_logs: List[str], start_ns: int) -> Dict[str, AnalysisResult]:
+        """Submete os logs em um único batch job (requisições inline) e converte as respostas."""
+        try:
+            job = await self.client.aio.batches.create(
+                model=self.settings.gemini_model,
+                src=[self._build_batch_request(raw_log) for raw_log in raw_logs],
+                config={"display_name": f"bug-finder-{uuid4().hex[:8]}"}
+            )
+            self.logger.info("Batch job %s submitted with %d logs", job.name, len(raw_logs))
+            job = await self._wait_for_batch_job(job)
+        except Exception as e:
+            self.logger.error("Error in batch analysis: %s", e)
+            return {raw_log: self._create_error_analysis(raw_log, str(e), start_ns) for raw_log in raw_logs}
+        
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            error_message = f"Batch job {job.name} finished with state {job.state.name}"
+            self.logger.error(error_message)
+            return {raw_log: self._create_error_analysis(raw_log, error_message, start_ns) for raw_log in raw_logs}
+        
+        # As respostas inline seguem a ordem das requisições
+        responses = list(job.dest.inlined_responses or []) if job.dest else []
+        semaphore = asyncio.Semaphore(self.settings.ai_max_concurrency)
+        
+        async def convert(index: int, raw_log: str) -> AnalysisResult:
+            inlined = responses[index] if index < len(responses) else None
+            if inlined is None or inlined.response is None:
+                error = inlined.error if inlined is not None else "missing response"
+                return self._create_error_analysis(raw_log, f"Batch request failed: {error}", start_ns)
+            async with semaphore:
+                return await self._result_from_batch_response(raw_log, inlined.response.text, start_ns)
+        
+        converted = await asyncio.gather(*(convert(i, raw_log) for i, raw_log in enumerate(raw_logs)))
+        return dict(zip(raw_logs, converted))
+    
+    def _build_batch_request(self, raw_log: str) -> Dict[str, Any]:
+        """Monta uma requisição inline do batch com o prompt log_analyser."""
+        return {
+            "contents": [{"parts": [{"text": get_prompt("log_analyser", raw_log=truncate_for_prompt(raw_log))}], "role": "user"}],
+            "config": self.generation_config
+        }
+    
+    async def _wait_for_batch_job(self, job):
+        """Consulta o job até um estado final, dobrando o intervalo entre consultas."""
+        delay = _BATCH_POLL_INITIAL_SECONDS
+        while job.state.name not in _BATCH_COMPLETED_STATES:
+            self.logger.debug("Batch job %s is %s, polling again in %ds", job.name, job.state.name, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
+            job = await self._get_batch_job(job.name)
+        return job
+    
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        wait=wait_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _get_batch_job(self, name: str):
+        """Busca o estado atual do batch job, com backoff em rate limit/timeout."""
+        return await self.client.aio.batches.get(name=name)
+    
+    async def _result_from_batch_response(self, raw_log: str, response_text: str, start_ns: int) -> AnalysisResult:
+        """Converte a resposta de um item do batch; se não for utilizável, segue pelo fluxo online."""
+        try:
+            parsed = self._parse_log_analysis(raw_log, response_text)
+            if parsed is None:
+                processed_log, bug_analysis = await self._process_raw_log_async(raw_log), None
+            else:
+                processed_log, bug_analysis = parsed
             
+            return await self._finish_analysis_async(raw_log, processed_log, bug_analysis, start_ns)
+            
+        except Exception as e:
+            self.logger.error("Error in log analysis: %s", e)
+            return self._create_error_analysis(raw_log, str(e), start_ns)
+    
+    def _create_result(self, raw_log: str, processed_log: ProcessedLog, bug_analysis: BugAnalysis,
+                       start_ns: int, use_cache: bool = True) -> AnalysisResult:
+        """Monta o resultado final da análise e o guarda no cache se a IA respondeu."""
+        processing_time = _elapsed_ms(start_ns)
+        
+        result = AnalysisResult(
+            log=processed_log.parsed_log,
+            analysis=bug_analysis,
+            processing_time_ms=processing_time,
+            analyzer_version="1.0.0"
+        )
+        
+        self.logger.info("Analysis completed - Bug: %s, Severity: %s, Decision: %s",
+                         bug_analysis.is_bug, bug_analysis.severity, bug_analysis.decision)
+        
+        # Fallbacks não são cacheados para que o log seja reanalisado depois
+        analysis_cache = self.analysis_cache if use_cache else None
+        if analysis_cache is not None and bug_analysis.analysis_notes != _FALLBACK_ANALYSIS_NOTES:
+            analysis_cache.put(raw_log, result)
+        
+        return result
+    
+    def _get_cached_result(self, raw_log: str, start_ns: int) -> Optional[AnalysisResult]:
+        """Retorna a análise de um log idêntico já processado, com timestamp e IDs atualizados."""
+        analysis_cache = self.analysis_cache
+        if analysis_cache is None:
+            return None
+        
+        result = analysis_cache.get(raw_log)
+        if result is None:
+            return None
+        
+        self.logger.info("Analysis cache hit, skipping AI calls")
+        result.log.timestamp = _timestamp_from_text(raw_log)
+        result.analysis.log_id = uuid4().hex
+        result.analysis.analysis_timestamp = datetime.now()
+        result.processing_time_ms = _elapsed_ms(start_ns)
+        return result
+    
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        wait=wait_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _generate_content_async(self, prompt: str):
+        """Chama o modelo de forma assíncrona, com backoff em rate limit/timeout."""
+        return await self.client.aio.models.generate_content(
+            model=self.settings.gemini_model,
+            contents=prompt,
+            config=self.generation_config
+        )
+    
+    def _process_and_analyze_fused(self, raw_log: str) -> Tuple[ProcessedLog, Optional[BugAnalysis]]:
+        """
+        Extrai e analisa o log em uma única chamada ao modelo (prompt log_analyser).
+        Se a resposta não puder ser usada, volta ao fluxo em duas etapas.
+        """
+        try:
+            self.logger.debug("Sending fused log analysis request to AI")
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=get_prompt("log_analyser", raw_log=truncate_for_prompt(raw_log)),
+                config=self.generation_config
+            )
+        except Exception as e:
+            return self._create_invalid_processed_log(raw_log, e), None
+        
+        parsed = self._parse_log_analysis(raw_log, response.text)
+        if parsed is None:
+            return self._process_raw_log(raw_log), None
+        return parsed
+    
+    async def _process_and_analyze_fused_async(self, raw_log: str) -> Tuple[ProcessedLog, Optional[BugAnalysis]]:
+        """Versão assíncrona de _process_and_analyze_fused."""
+        try:
+            self.logger.debug("Sending fused log analysis request to AI")
+            response = await self._generate_content_async(
+                get_prompt("log_analyser", raw_log=truncate_for_prompt(raw_log))
+            )
         except Exception as e:
-            self.logger.error(f"Error in log analysis: {str(e)}")
-            return self._create_error_analysis(raw_log, str(e), start_time)
+            return self._create_invalid_processed_log(raw_log, e), None
+        
+        parsed = self._parse_log_analysis(raw_log, response.text)
+        if parsed is None:
+            return await self._process_raw_log_async(raw_log), None
+        return parsed
+    
+    def _parse_log_analysis(self, raw_log: str, response_text: str) -> Optional[Tuple[ProcessedLog, Optional[BugAnalysis]]]:
+        """
+        Converte a resposta do log_analyser em (ProcessedLog, BugAnalysis).
+        Retorna None se a resposta não for um JSON utilizável; a análise é None
+        quando o log é inválido ou a resposta não trouxe "bug_analysis".
+        """
+        try:
+            result = load_response_json(response_text)
+        except ValueError as e:
+            self.logger.warning("Failed to parse fused analysis response as JSON: %s", e)
+            return None
+        
+        if not isinstance(result, dict):
+            return None
+        
+        processed_log = self._processed_log_from_result(raw_log, result)
+        bug_result = result.get("bug_analysis")
+        if not processed_log.is_valid or not isinstance(bug_result, dict):
+            return processed_log, None
+        
+        return processed_log, self._bug_analysis_from_result(bug_result)
     
     def _process_raw_log(self, raw_log: str) -> ProcessedLog:
         """Processa o log bruto e extrai informações estruturadas."""
         try:
-            # Prompt para processamento de log
-            prompt = get_prompt("log_receiver", raw_log=raw_log)
-            
             self.logger.debug("Sending log processing request to AI")
-            response = self.model.generate_content(
-                prompt, 
-                generation_config=self.generation_config
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=get_prompt("log_receiver", raw_log=truncate_for_prompt(raw_log)),
+                config=self.generation_config
             )
-            
-            # Parse da resposta JSON
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3].strip()
-            
-            result = json.loads(response_text)
-            
+        except Exception as e:
+            return self._create_invalid_processed_log(raw_log, e)
+        
+        return self._parse_processed_log(raw_log, response.text)
+    
+    async def _process_raw_log_async(self, raw_log: str) -> ProcessedLog:
+        """Versão assíncrona de _process_raw_log."""
+        try:
+            self.logger.debug("Sending log processing request to AI")
+            response = await self._generate_content_async(
+                get_prompt("log_receiver", raw_log=truncate_for_prompt(raw_log))
+            )
+        except Exception as e:
+            return self._create_invalid_processed_log(raw_log, e)
+        
+        return self._parse_processed_log(raw_log, response.text)
+    
+    def _parse_processed_log(self, raw_log: str, response_text: str) -> ProcessedLog:
+        """Converte a resposta do log_receiver em ProcessedLog."""
+        try:
+            result = load_response_json(response_text)
+        except ValueError as e:
+            # from_json sinaliza JSON inválido com ValueError
+            self.logger.error("Failed to parse AI response as JSON: %s", e)
+            return ProcessedLog(
+                raw_log=raw_log,
+                parsed_log=self._create_fallback_log(raw_log),
+                is_valid=False,
+                validation_errors=[f"JSON parse error: {str(e)}"]
+            )
+        
+        return self._processed_log_from_result(raw_log, result)
+    
+    def _processed_log_from_result(self, raw_log: str, result: Dict[str, Any]) -> ProcessedLog:
+        """Monta o ProcessedLog a partir do JSON de extração já decodificado."""
+        try:
             # Criar LogModel a partir do resultado
             if result.get("is_valid", False) and "parsed_log" in result:
                 parsed_data = result["parsed_log"]
@@ -107,10 +463,14 @@ class BugAnalyserAgent:
                 
                 # Garantir que level seja válido
                 level = parsed_data.get("level", "ERROR")
-                if level not in [e.value for e in LogLevel]:
+                if level not in _LOG_LEVEL_VALUES:
                     level = "ERROR"
                 parsed_data["level"] = level
                 
+                # O modelo viu só a versão truncada; guardar o texto completo para inspeção
+                if len(raw_log) > MAX_PROMPT_INPUT_CHARS:
+                    parsed_data["additional_data"] = {**(parsed_data.get("additional_data") or {}), "raw_input": raw_log}
+                
                 log_model = LogModel(**parsed_data)
                 
                 return ProcessedLog(
@@ -128,63 +488,84 @@ class BugAnalyserAgent:
                     validation_errors=result.get("validation_errors", ["Failed to parse log"])
                 )
                 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse AI response as JSON: {e}")
-            return ProcessedLog(
-                raw_log=raw_log,
-                parsed_log=self._create_fallback_log(raw_log),
-                is_valid=False,
-                validation_errors=[f"JSON parse error: {str(e)}"]
-            )
         except Exception as e:
-            self.logger.error(f"Error processing log: {e}")
-            return ProcessedLog(
-                raw_log=raw_log,
-                parsed_log=self._create_fallback_log(raw_log),
-                is_valid=False,
-                validation_errors=[f"Processing error: {str(e)}"]
-            )
+            return self._create_invalid_processed_log(raw_log, e)
+    
+    def _create_invalid_processed_log(self, raw_log: str, error: Exception) -> ProcessedLog:
+        """Cria um ProcessedLog inválido a partir de um erro de processamento."""
+        self.logger.error("Error processing log: %s", error)
+        return ProcessedLog(
+            raw_log=raw_log,
+            parsed_log=self._create_fallback_log(raw_log),
+            is_valid=False,
+            validation_errors=[f"Processing error: {str(error)}"]
+        )
     
     def _analyze_bug(self, processed_log: ProcessedLog) -> BugAnalysis:
         """Analisa se o log processado representa um bug real."""
         try:
-            # Preparar contexto do log para análise
-            log_context = {
-                "timestamp": processed_log.parsed_log.timestamp.isoformat(),
-                "level": processed_log.parsed_log.level,
-                "message": processed_log.parsed_log.message,
-                "source": processed_log.parsed_log.source,
-                "function_name": processed_log.parsed_log.function_name,
-                "stack_trace": processed_log.parsed_log.stack_trace,
-                "additional_data": processed_log.parsed_log.additional_data
-            }
-            
-            # Prompt para análise de bug
-            prompt = get_prompt("bug_analyser", log_context=json.dumps(log_context, indent=2))
-            
             self.logger.debug("Sending bug analysis request to AI")
-            response = self.model.generate_content(
-                prompt,
-                generation_config=self.generation_config
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=self._build_bug_analysis_prompt(processed_log),
+                config=self.generation_config
             )
-            
-            # Parse da resposta JSON
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3].strip()
-            
-            result = json.loads(response_text)
-            
-            # Criar BugAnalysis
-            analysis = BugAnalysis(
-                log_id=str(uuid4()),
+        except Exception as e:
+            self.logger.error("Error in bug analysis: %s", e)
+            return self._create_fallback_analysis()
+        
+        return self._parse_bug_analysis(response.text)
+    
+    async def _analyze_bug_async(self, processed_log: ProcessedLog) -> BugAnalysis:
+        """Versão assíncrona de _analyze_bug."""
+        try:
+            self.logger.debug("Sending bug analysis request to AI")
+            response = await self._generate_content_async(
+                self._build_bug_analysis_prompt(processed_log)
+            )
+        except Exception as e:
+            self.logger.error("Error in bug analysis: %s", e)
+            return self._create_fallback_analysis()
+        
+        return self._parse_bug_analysis(response.text)
+    
+    def _build_bug_analysis_prompt(self, processed_log: ProcessedLog) -> str:
+        """Monta o prompt de análise de bug a partir do log processado."""
+        # Preparar contexto do log para análise
+        log_context = {
+            "timestamp": processed_log.parsed_log.timestamp,
+            "level": processed_log.parsed_log.level,
+            "message": processed_log.parsed_log.message,
+            "source": processed_log.parsed_log.source,
+            "function_name": processed_log.parsed_log.function_name,
+            "stack_trace": processed_log.parsed_log.stack_trace,
+            "additional_data": processed_log.parsed_log.get_prompt_additional_data()
+        }
+        
+        # Prompt para análise de bug
+        return get_prompt("bug_analyser", log_context=truncate_for_prompt(to_json(log_context).decode()))
+    
+    def _parse_bug_analysis(self, response_text: str) -> BugAnalysis:
+        """Converte a resposta do bug_analyser em BugAnalysis."""
+        try:
+            result = load_response_json(response_text)
+        except ValueError as e:
+            # from_json sinaliza JSON inválido com ValueError
+            self.logger.error("Failed to parse analysis response as JSON: %s", e)
+            return self._create_fallback_analysis()
+        
+        return self._bug_analysis_from_result(result)
+    
+    def _bug_analysis_from_result(self, result: Dict[str, Any]) -> BugAnalysis:
+        """Monta o BugAnalysis a partir do JSON de análise já decodificado."""
+        try:
+            return BugAnalysis(
+                log_id=uuid4().hex,
                 is_bug=result.get("is_bug", False),
-                severity=BugSeverity(result.get("severity", "low")),
-                category=BugCategory(result.get("category", "other")),
-                impact=BugImpact(result.get("impact", "low_impact")),
-                decision=AnalysisDecision(result.get("decision", "ignore")),
+                severity=enum_from_response(_SEVERITY_BY_VALUE, result.get("severity"), BugSeverity.LOW),
+                category=enum_from_response(_CATEGORY_BY_VALUE, result.get("category"), BugCategory.OTHER),
+                impact=enum_from_response(_IMPACT_BY_VALUE, result.get("impact"), BugImpact.LOW_IMPACT),
+                decision=enum_from_response(_DECISION_BY_VALUE, result.get("decision"), AnalysisDecision.IGNORE),
                 root_cause_hypothesis=result.get("root_cause_hypothesis"),
                 affected_components=result.get("affected_components", []),
                 reproduction_likelihood=result.get("reproduction_likelihood", 0.0),
@@ -192,14 +573,8 @@ class BugAnalyserAgent:
                 confidence_score=result.get("confidence_score", 0.0),
                 analysis_notes=result.get("analysis_notes")
             )
-            
-            return analysis
-            
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse analysis response as JSON: {e}")
-            return self._create_fallback_analysis()
         except Exception as e:
-            self.logger.error(f"Error in bug analysis: {e}")
+            self.logger.error("Error in bug analysis: %s", e)
             return self._create_fallback_analysis()
     
     def _create_fallback_log(self, raw_log: str) -> LogModel:
@@ -215,7 +590,7 @@ class BugAnalyserAgent:
     def _create_fallback_analysis(self) -> BugAnalysis:
         """Cria uma análise básica quando a análise AI falha."""
         return BugAnalysis(
-            log_id=str(uuid4()),
+            log_id=uuid4().hex,
             is_bug=False,
             severity=BugSeverity.LOW,
             category=BugCategory.OTHER,
@@ -223,15 +598,15 @@ class BugAnalyserAgent:
             decision=AnalysisDecision.IGNORE,
             confidence_score=0.0,
             priority_score=0.0,
-            analysis_notes="Analysis failed, created fallback"
+            analysis_notes=_FALLBACK_ANALYSIS_NOTES
         )
     
-    def _create_failed_analysis(self, raw_log: str, processed_log: ProcessedLog, start_time: datetime) -> AnalysisResult:
+    def _create_failed_analysis(self, raw_log: str, processed_log: ProcessedLog, start_ns: int) -> AnalysisResult:
         """Cria um resultado de análise para logs que falharam no processamento."""
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = _elapsed_ms(start_ns)
         
         analysis = BugAnalysis(
-            log_id=str(uuid4()),
+            log_id=uuid4().hex,
             is_bug=False,
             severity=BugSeverity.LOW,
             category=BugCategory.OTHER,
@@ -249,13 +624,13 @@ class BugAnalyserAgent:
             analyzer_version="1.0.0"
         )
     
-    def _create_error_analysis(self, raw_log: str, error_message: str, start_time: datetime) -> AnalysisResult:
+    def _create_error_analysis(self, raw_log: str, error_message: str, start_ns: int) -> AnalysisResult:
         """Cria um resultado de análise para erros inesperados."""
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = _elapsed_ms(start_ns)
         
         fallback_log = self._create_fallback_log(raw_log)
         analysis = BugAnalysis(
-            log_id=str(uuid4()),
+            log_id=uuid4().hex,
             is_bug=False,
             severity=BugSeverity.LOW,
             category=BugCategory.OTHER,
@@ -1,22 +1,48 @@
 import logging
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from uuid import uuid4
-from dotenv import load_dotenv
 
-import google.generativeai as genai
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 
 from ..models import (
     BugFinderProcess, ProcessStatus, AnalysisResult, IssueModel
 )
-from ..config import get_settings
+from ..config import get_settings, load_environment
 from .bug_analyser_agent import BugAnalyserAgent
 from .issue_manager_agent import IssueManagerAgent
 from .notification_agent import NotificationAgent
 
+# Palavras-chave críticas literais: um simples `in` basta (inclui os níveis
+# critical/fatal/emergency, cobrindo também logs que começam com eles)
+_CRITICAL_KEYWORDS = (
+    'critical', 'fatal', 'severe', 'emergency',
+    'system crashed', 'system down', 'service down'
+)
+
+# Padrões críticos agrupados por um literal obrigatório: o regex só roda quando
+# o literal aparece no log (compilados uma única vez, na importação do módulo)
+_CRITICAL_PATTERN_BUCKETS = (
+    ('payment', re.compile(r'payment.*(?:failed|crash|error)')),
+    ('revenue', re.compile(r'revenue.*(?:loss|\$\d+)')),
+    ('business', re.compile(r'business.*impact')),
+    ('customers', re.compile(r'all.*customers.*affected|100%.*customers|error.*affects.*\d+%.*customers')),
+    ('data', re.compile(r'data.*(?:corruption|loss)')),
+    ('security', re.compile(r'security.*breach')),
+    ('unauthorized', re.compile(r'unauthorized.*access')),
+    ('unable', re.compile(r'unable.*process.*payments|system.*unable.*process|all.*users.*unable')),
+    ('transactions', re.compile(r'all.*transactions.*failing')),
+)
+
+
+# Palavras que indicam que a entrada de run() é um log (uma única varredura, sem lower())
+_LOG_KEYWORDS_RE = re.compile(r'error|exception|traceback|failed', re.IGNORECASE)
+
 
 class BugFinderSystem:
     """
@@ -31,7 +57,7 @@ class BugFinderSystem:
     
     def __init__(self):
         # Ensure .env is loaded first
-        load_dotenv()
+        load_environment()
         
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
@@ -40,9 +66,8 @@ class BugFinderSystem:
         if not self.settings.google_ai_api_key:
             raise ValueError("GOOGLE_AI_API_KEY is required but not found in environment")
         
-        # Set Google AI API key as environment variable for ADK and configure genai
-        os.environ['GOOGLE_AI_API_KEY'] = self.settings.google_ai_api_key
-        genai.configure(api_key=self.settings.google_ai_api_key)
+        # Os agentes recebem a chave explicitamente; o ADK só a lê de GOOGLE_API_KEY
+        os.environ.setdefault('GOOGLE_API_KEY', self.settings.google_ai_api_key)
         
         # Inicializar agentes especializados
         self.bug_analyser = BugAnalyserAgent()
@@ -132,51 +157,22 @@ class BugFinderSystem:
         """
         log_lower = log_content.lower()
         
-        # Palavras-chave críticas
-        critical_keywords = [
-            'critical', 'fatal', 'severe', 'emergency',
-            'system crashed', 'system down', 'service down',
-            'payment.*failed', 'payment.*crash', 'payment.*error',
-            'revenue.*loss', 'business.*impact',
-            'all.*customers.*affected', '100%.*customers',
-            'data.*corruption', 'data.*loss',
-            'security.*breach', 'unauthorized.*access',
-            'nullpointerexception.*critical',
-            'unable.*process.*payments',
-            'all.*transactions.*failing'
-        ]
-        
         # Verificar palavras-chave críticas
-        for keyword in critical_keywords:
-            import re
-            if re.search(keyword, log_lower):
-                return True
-        
-        # Verificar nível crítico no início
-        if log_lower.strip().startswith(('critical', 'fatal', 'emergency')):
+        if any(keyword in log_lower for keyword in _CRITICAL_KEYWORDS):
             return True
         
-        # Verificar padrões de impacto de negócio
-        business_impact_patterns = [
-            r'business.*impact.*severe',
-            r'revenue.*\$\d+',
-            r'error.*affects.*\d+%.*customers',
-            r'system.*unable.*process',
-            r'all.*users.*unable'
-        ]
-        
-        for pattern in business_impact_patterns:
-            if re.search(pattern, log_lower):
-                return True
-        
-        return False
+        # Verificar padrões de impacto de negócio, apenas nos grupos cujo literal aparece
+        return any(
+            literal in log_lower and pattern.search(log_lower)
+            for literal, pattern in _CRITICAL_PATTERN_BUCKETS
+        )
     
     def _process_critical_log_forced(self, log_content: str) -> Dict[str, Any]:
         """
         Processa um log crítico forçando criação de issue e notificação Discord,
         mesmo se o sistema interno de análise falhar.
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             self.logger.info("🚨 CRITICAL LOG DETECTED - Forcing issue creation")
@@ -209,7 +205,7 @@ class BugFinderSystem:
                 else:
                     self.logger.warning("❌ Discord notification failed")
                 
-                processing_time = (datetime.now() - start_time).total_seconds() * 1000
+                processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
                 return {
                     "status": "success",
@@ -268,7 +264,7 @@ class BugFinderSystem:
         
         # Create forced critical analysis
         critical_analysis = BugAnalysis(
-            log_id=str(uuid4()),
+            log_id=uuid4().hex,
             is_bug=True,
             severity=BugSeverity.CRITICAL,
             category=BugCategory.RUNTIME_ERROR,
@@ -403,7 +399,8 @@ class BugFinderSystem:
             # Check if this looks like a critical log that should trigger full workflow
             if self._is_critical_log(log_sample):
                 self.logger.info("Critical log detected! Triggering full workflow instead of sample analysis.")
-                return self._process_log_wrapper(log_sample)
+                # Já classificado como crítico: não repetir a verificação de _process_log_wrapper
+                return self._process_critical_log_forced(log_sample)
             
             return self.analyze_sample_log(log_sample)
         except Exception as e:
@@ -524,7 +521,11 @@ class BugFinderSystem:
                     "model": self.settings.gemini_model,
                     "configured": bool(self.settings.google_ai_api_key)
                 }
-            }
+            },
+            "analysis_cache": (
+                self.bug_analyser.analysis_cache.get_stats()
+                if self.bug_analyser.analysis_cache is not None else {"enabled": False}
+            )
         }
     
     def test_integrations(self) -> Dict[str, Any]:
@@ -537,39 +538,31 @@ class BugFinderSystem:
         results = {}
         
         try:
-            # Teste GitHub
-            self.logger.info("Testing GitHub integration...")
-            github_test = self.issue_manager.github_tool.test_connection()
+            # As três verificações são round-trips de rede independentes:
+            # executá-las em paralelo reduz o tempo total ao da mais lenta
+            self.logger.info("Testing GitHub, Discord and AI integrations...")
+            github_test, discord_test, ai_error = self._run_integration_checks()
+            
             results["github"] = {
                 "status": "success" if github_test else "failed",
                 "message": "Connection successful" if github_test else "Connection failed"
             }
             
-            # Teste Discord
-            self.logger.info("Testing Discord integration...")
-            discord_test = self.notification_agent.send_test_notification()
             results["discord"] = {
                 "status": "success" if discord_test else "failed", 
                 "message": "Test notification sent" if discord_test else "Failed to send test notification"
             }
             
-            # Teste AI
-            self.logger.info("Testing AI integration...")
-            try:
-                test_analysis = self.bug_analyser.process_and_analyze_log("Test log message")
-                ai_test = test_analysis is not None
-            except Exception as e:
-                ai_test = False
-                results["ai"] = {
-                    "status": "failed",
-                    "message": f"AI test failed: {str(e)}"
-                }
-            
-            if ai_test and "ai" not in results:
+            if ai_error is None:
                 results["ai"] = {
                     "status": "success",
                     "message": "AI analysis working"
                 }
+            else:
+                results["ai"] = {
+                    "status": "failed",
+                    "message": ai_error
+                }
             
             # Resultado geral
             all_passed = all(result["status"] == "success" for result in results.values())
@@ -586,6 +579,25 @@ class BugFinderSystem:
         
         return results
     
+    def _run_integration_checks(self):
+        """Executa os testes de GitHub, Discord e IA concorrentemente em threads."""
+        def check_ai() -> Optional[str]:
+            try:
+                # Sem cache: o teste precisa de fato chamar a API
+                test_analysis = self.bug_analyser.process_and_analyze_log("Test log message", use_cache=False)
+            except Exception as e:
+                return f"AI test failed: {str(e)}"
+            return None if test_analysis is not None else "AI test failed: no analysis returned"
+        
+        # Threads em vez de asyncio.run: o ADK chama esta tool de dentro do seu event loop
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.issue_manager.github_tool.test_connection),
+                executor.submit(self.notification_agent.send_test_notification),
+                executor.submit(check_ai),
+            ]
+            return [future.result() for future in futures]
+    
     def analyze_sample_log(self, log_sample: str) -> Dict[str, Any]:
         """
         Analisa um log de exemplo sem criar issue (apenas para teste).
@@ -663,13 +675,14 @@ class BugFinderSystem:
         """
         if input_text:
             # Se parece com um log, processar
-            if any(keyword in input_text.lower() for keyword in ['error', 'exception', 'traceback', 'failed']):
+            if _LOG_KEYWORDS_RE.search(input_text):
                 return self.process_log(input_text)
             
             # Comandos especiais
-            if input_text.lower() == "status":
+            command = input_text.lower()
+            if command == "status":
                 return self.get_system_status()
-            elif input_text.lower() == "test":
+            elif command == "test":
                 return self.test_integrations()
             else:
                 return self.analyze_sample_log(input_text)
@@ -1,19 +1,42 @@
-import json
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import uuid4
 
-import google.generativeai as genai
+from google.genai import types
+from pydantic_core import to_json
 
 from ..models import (
     IssueModel, IssueDraft, IssueStatus, IssuePriority, IssueLabel,
     AnalysisResult, ReviewFeedback, IssueCreationRequest, 
     GitHubIssueCreation, CreationAttempt, DetailedSolution, 
-    ImplementationPlan, SolutionType, EffortEstimate
+    ImplementationPlan, SolutionType, EffortEstimate, BugSeverity, BugCategory
 )
-from ..config import get_settings, get_prompt
+from ..config import get_settings, get_prompt, get_genai_client, truncate_for_prompt
 from ..tools import GitHubTool
+from .response_utils import enum_from_response, load_response_json
+
+# Valores aceitos na resposta da IA -> membros dos enums, montados uma única vez
+_PRIORITY_BY_VALUE = {member.value: member for member in IssuePriority}
+_LABEL_BY_VALUE = {member.value: member for member in IssueLabel}
+_SOLUTION_TYPE_BY_VALUE = {member.value: member for member in SolutionType}
+_EFFORT_BY_VALUE = {member.value: member for member in EffortEstimate}
+
+# Labels derivadas da análise, montadas uma única vez
+_BASE_LABELS = (IssueLabel.BUG, IssueLabel.AUTO_GENERATED)
+
+_SEVERITY_LABELS = {
+    BugSeverity.CRITICAL: (IssueLabel.CRITICAL,),
+    BugSeverity.HIGH: (IssueLabel.HIGH_PRIORITY,),
+}
+
+_CATEGORY_LABELS = {
+    BugCategory.RUNTIME_ERROR: (IssueLabel.RUNTIME_ERROR,),
+    BugCategory.NETWORK_ERROR: (IssueLabel.NETWORK_ISSUE,),
+    BugCategory.DATABASE_ERROR: (IssueLabel.DATABASE_ISSUE,),
+    BugCategory.SECURITY_ISSUE: (IssueLabel.SECURITY,),
+    BugCategory.PERFORMANCE_ISSUE: (IssueLabel.PERFORMANCE,),
+}
 
 
 class IssueManagerAgent:
@@ -25,19 +48,20 @@ class IssueManagerAgent:
         if not self.settings.google_ai_api_key:
             raise ValueError("GOOGLE_AI_API_KEY is required but not found in environment")
         
-        # Configure Google AI with explicit API key
-        genai.configure(api_key=self.settings.google_ai_api_key)
-        self.model = genai.GenerativeModel(self.settings.gemini_model)
-        
         # Generation config
-        self.generation_config = {
-            "temperature": self.settings.gemini_temperature,
-            "max_output_tokens": self.settings.gemini_max_tokens,
-        }
+        self.generation_config = types.GenerateContentConfig(
+            temperature=self.settings.gemini_temperature,
+            max_output_tokens=self.settings.gemini_max_tokens,
+        )
         
         # GitHub tool
         self.github_tool = GitHubTool()
     
+    @property
+    def client(self):
+        """Cliente Google AI compartilhado; buscado a cada uso para acompanhar reload_settings()."""
+        return get_genai_client()
+    
     def create_and_publish_issue(self, analysis_result: AnalysisResult) -> Optional[IssueModel]:
         """
         Gerencia todo o processo de criação de issue:
@@ -94,27 +118,22 @@ class IssueManagerAgent:
             bug_analysis = analysis_result.analysis.get_analysis_summary()
             
             context = {
-                "log_context": json.dumps(log_context, indent=2, default=str),
-                "bug_analysis": json.dumps(bug_analysis, indent=2, default=str)
+                "log_context": truncate_for_prompt(to_json(log_context).decode()),
+                "bug_analysis": to_json(bug_analysis).decode()
             }
             
             # Gerar prompt e solicitar criação
             prompt = get_prompt("issue_drafter", **context)
             
             self.logger.debug("Sending issue draft creation request to AI")
-            response = self.model.generate_content(
-                prompt,
-                generation_config=self.generation_config
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=prompt,
+                config=self.generation_config
             )
             
             # Parse da resposta
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3].strip()
-            
-            result = json.loads(response_text)
+            result = load_response_json(response.text)
             
             # Parsear soluções detalhadas
             suggested_solutions = self._parse_detailed_solutions(result.get("suggested_solutions", []))
@@ -148,7 +167,7 @@ class IssueManagerAgent:
             
             return draft
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"Failed to parse issue draft response: {e}")
             return None
         except Exception as e:
@@ -213,27 +232,22 @@ class IssueManagerAgent:
             bug_analysis = issue.bug_analysis.get_analysis_summary()
             
             context = {
-                "issue_content": json.dumps(issue_content, indent=2),
-                "bug_analysis": json.dumps(bug_analysis, indent=2)
+                "issue_content": to_json(issue_content).decode(),
+                "bug_analysis": to_json(bug_analysis).decode()
             }
             
             # Gerar prompt e solicitar revisão
             prompt = get_prompt("issue_reviewer", **context)
             
             self.logger.debug("Sending issue review request to AI")
-            response = self.model.generate_content(
-                prompt,
-                generation_config=self.generation_config
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=prompt,
+                config=self.generation_config
             )
             
             # Parse da resposta
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3].strip()
-            
-            result = json.loads(response_text)
+            result = load_response_json(response.text)
             
             # Criar ReviewFeedback
             review = ReviewFeedback(
@@ -252,7 +266,7 @@ class IssueManagerAgent:
             
             return review
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"Failed to parse review response: {e}")
             return None
         except Exception as e:
@@ -299,8 +313,8 @@ class IssueManagerAgent:
             }
             
             context = {
-                "original_issue": json.dumps(original_issue, indent=2),
-                "review_feedback": json.dumps(review_feedback, indent=2),
+                "original_issue": to_json(original_issue).decode(),
+                "review_feedback": to_json(review_feedback).decode(),
                 "refinement_instructions": refinement_instructions
             }
             
@@ -308,19 +322,14 @@ class IssueManagerAgent:
             prompt = get_prompt("issue_refiner", **context)
             
             self.logger.debug("Sending issue refinement request to AI")
-            response = self.model.generate_content(
-                prompt,
-                generation_config=self.generation_config
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=prompt,
+                config=self.generation_config
             )
             
             # Parse da resposta
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3].strip()
-            
-            result = json.loads(response_text)
+            result = load_response_json(response.text)
             
             # Atualizar draft com versão refinada
             issue.draft.title = result.get("title", issue.draft.title)
@@ -352,25 +361,19 @@ class IssueManagerAgent:
             issue.draft.suggested_fixes = result.get("suggested_fixes", issue.draft.suggested_fixes)
             issue.draft.resolution_steps = result.get("resolution_steps", issue.draft.resolution_steps)
             
-            # Atualizar prioridade se especificada
+            # Atualizar prioridade se especificada (mantém a atual se inválida)
             if "priority" in result:
-                try:
-                    issue.draft.priority = IssuePriority(result["priority"])
-                except:
-                    pass  # Manter prioridade atual se inválida
-            
-            # Atualizar labels se especificadas
-            if "labels" in result:
-                try:
-                    new_labels = [IssueLabel(label) for label in result["labels"] if label in [e.value for e in IssueLabel]]
-                    issue.draft.labels = new_labels
-                except:
-                    pass  # Manter labels atuais se inválidas
+                issue.draft.priority = enum_from_response(_PRIORITY_BY_VALUE, result["priority"], issue.draft.priority)
+            
+            # Atualizar labels se especificadas (mantém as atuais se inválidas)
+            if isinstance(result.get("labels"), list):
+                new_labels = (enum_from_response(_LABEL_BY_VALUE, label) for label in result["labels"])
+                issue.draft.labels = [label for label in new_labels if label is not None]
             
             issue.update_status(IssueStatus.UNDER_REVIEW)
             return True
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"Failed to parse refinement response: {e}")
             return False
         except Exception as e:
@@ -434,28 +437,13 @@ class IssueManagerAgent:
     
     def _add_smart_labels(self, draft: IssueDraft, analysis) -> None:
         """Adiciona labels inteligentes baseadas na análise."""
-        # Label obrigatória
-        draft.add_label(IssueLabel.BUG)
-        draft.add_label(IssueLabel.AUTO_GENERATED)
-        
-        # Labels baseadas na severidade
-        if analysis.severity.value == "critical":
-            draft.add_label(IssueLabel.CRITICAL)
-        elif analysis.severity.value == "high":
-            draft.add_label(IssueLabel.HIGH_PRIORITY)
-        
-        # Labels baseadas na categoria
-        category_mapping = {
-            "runtime_error": IssueLabel.RUNTIME_ERROR,
-            "network_error": IssueLabel.NETWORK_ISSUE,
-            "database_error": IssueLabel.DATABASE_ISSUE,
-            "security_issue": IssueLabel.SECURITY,
-            "performance_issue": IssueLabel.PERFORMANCE
-        }
-        
-        category_label = category_mapping.get(analysis.category.value)
-        if category_label:
-            draft.add_label(category_label)
+        # Labels obrigatórias + baseadas na severidade e na categoria
+        for label in (
+            *_BASE_LABELS,
+            *_SEVERITY_LABELS.get(analysis.severity, ()),
+            *_CATEGORY_LABELS.get(analysis.category, ()),
+        ):
+            draft.add_label(label)
         
         # Label para investigação se confidence baixa
         if analysis.confidence_score < 0.8:
@@ -467,19 +455,9 @@ class IssueManagerAgent:
         
         for solution_data in solutions_data:
             try:
-                # Validar e converter tipo da solução
-                solution_type = SolutionType.QUICK_FIX  # default
-                if "type" in solution_data:
-                    type_value = solution_data["type"]
-                    if type_value in [t.value for t in SolutionType]:
-                        solution_type = SolutionType(type_value)
-                
-                # Validar e converter estimativa de esforço
-                effort_estimate = EffortEstimate.MEDIUM  # default
-                if "effort_estimate" in solution_data:
-                    effort_value = solution_data["effort_estimate"]
-                    if effort_value in [e.value for e in EffortEstimate]:
-                        effort_estimate = EffortEstimate(effort_value)
+                # Validar e converter tipo da solução e estimativa de esforço
+                solution_type = enum_from_response(_SOLUTION_TYPE_BY_VALUE, solution_data.get("type"), SolutionType.QUICK_FIX)
+                effort_estimate = enum_from_response(_EFFORT_BY_VALUE, solution_data.get("effort_estimate"), EffortEstimate.MEDIUM)
                 
                 solution = DetailedSolution(
                     type=solution_type,
@@ -1,17 +1,21 @@
-import json
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import uuid4
 
-import google.generativeai as genai
+from google.genai import types
 
 from ..models import (
     IssueModel, NotificationModel, NotificationChannel, 
-    NotificationPriority, create_discord_notification_from_issue
+    NotificationPriority, BugSeverity, create_discord_notification_from_issue
 )
-from ..config import get_settings, get_prompt
+from ..config import get_settings, get_prompt, get_genai_client
 from ..tools import DiscordTool
+from .response_utils import load_response_json
+
+
+# Severidades que sempre geram notificação
+_ALWAYS_NOTIFY_SEVERITIES = frozenset({BugSeverity.CRITICAL, BugSeverity.HIGH})
 
 
 class NotificationAgent:
@@ -23,19 +27,20 @@ class NotificationAgent:
         if not self.settings.google_ai_api_key:
             raise ValueError("GOOGLE_AI_API_KEY is required but not found in environment")
         
-        # Configure Google AI with explicit API key
-        genai.configure(api_key=self.settings.google_ai_api_key)
-        self.model = genai.GenerativeModel(self.settings.gemini_model)
-        
         # Generation config
-        self.generation_config = {
-            "temperature": self.settings.gemini_temperature,
-            "max_output_tokens": self.settings.gemini_max_tokens,
-        }
+        self.generation_config = types.GenerateContentConfig(
+            temperature=self.settings.gemini_temperature,
+            max_output_tokens=self.settings.gemini_max_tokens,
+        )
         
         # Discord tool
         self.discord_tool = DiscordTool()
     
+    @property
+    def client(self):
+        """Cliente Google AI compartilhado; buscado a cada uso para acompanhar reload_settings()."""
+        return get_genai_client()
+    
     def send_issue_notification(self, issue: IssueModel) -> bool:
         """
         Envia notificação sobre a issue criada.
@@ -71,17 +76,19 @@ class NotificationAgent:
     
     def _should_notify(self, issue: IssueModel) -> bool:
         """Determina se a issue deve gerar notificação."""
+        analysis = issue.bug_analysis
+        severity = analysis.severity
+        
         # Sempre notificar para bugs críticos e altos
-        if issue.bug_analysis.severity.value in ["critical", "high"]:
+        if severity in _ALWAYS_NOTIFY_SEVERITIES:
             return True
         
         # Notificar para bugs médios se tiver alta confiança
-        if (issue.bug_analysis.severity.value == "medium" and 
-            issue.bug_analysis.confidence_score >= 0.8):
+        if severity == BugSeverity.MEDIUM and analysis.confidence_score >= 0.8:
             return True
         
         # Notificar se requer atenção imediata
-        if issue.bug_analysis.requires_immediate_attention():
+        if analysis.requires_immediate_attention():
             return True
         
         # Não notificar para bugs baixos por padrão
@@ -169,23 +176,18 @@ class NotificationAgent:
             prompt = get_prompt("issue_notificator", **context)
             
             self.logger.debug("Sending notification content generation request to AI")
-            response = self.model.generate_content(
-                prompt,
-                generation_config=self.generation_config
+            response = self.client.models.generate_content(
+                model=self.settings.gemini_model,
+                contents=prompt,
+                config=self.generation_config
             )
             
             # Parse da resposta
-            response_text = response.text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:-3].strip()
-            elif response_text.startswith("```"):
-                response_text = response_text[3:-3].strip()
-            
-            result = json.loads(response_text)
+            result = load_response_json(response.text)
             
             return result
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self.logger.error(f"Failed to parse notification content response: {e}")
             return None
         except Exception as e:
@@ -245,16 +247,15 @@ class NotificationAgent:
             title = "❌ Erro no Bug Finder"
             
             # Preparar mensagem com contexto
-            message = f"Ocorreu um erro no sistema Bug Finder:\n\n**Erro:** {error_message}"
-            
+            parts = [f"Ocorreu um erro no sistema Bug Finder:\n\n**Erro:** {error_message}"]
+
             if context:
-                message += f"\n\n**Contexto:**\n"
-                for key, value in context.items():
-                    message += f"- {key}: `{value}`\n"
-            
+                parts.append("\n\n**Contexto:**\n")
+                parts.extend(f"- {key}: `{value}`\n" for key, value in context.items())
+
             return self.send_system_notification(
                 title=title,
-                message=message,
+                message="".join(parts),
                 priority=NotificationPriority.HIGH
             )
             
@@ -0,0 +1,39 @@
+import re
+from typing import Any, Dict
+
+from pydantic_core import from_json
+
+
+# Cerca de abertura do bloco de código markdown (```json ou ```)
+_OPENING_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+
+
+def strip_code_fences(response_text: str) -> str:
+    """
+    Retorna o conteúdo da resposta sem as cercas de código markdown.
+    Tolera a ausência da cerca de fechamento quando a resposta do modelo vem truncada.
+    """
+    text = response_text.strip()
+    opening = _OPENING_FENCE_RE.match(text)
+    if opening is None:
+        return text
+    
+    text = text[opening.end():]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def load_response_json(response_text: str) -> Any:
+    """
+    Remove cercas de código markdown da resposta do modelo e faz o parse do JSON.
+    Levanta ValueError se a resposta não for um JSON válido.
+    """
+    return from_json(strip_code_fences(response_text))
+
+
+def enum_from_response(mapping: Dict[str, Any], value: Any, default=None):
+    """Converte um valor da resposta no membro do enum (via mapa valor -> membro); valores desconhecidos usam o default."""
+    if isinstance(value, str):
+        return mapping.get(value.lower(), default)
+    return default
@@ -0,0 +1,29 @@
+"""
+Inicialização compartilhada dos pontos de entrada do ADK.
+
+adk_agent.py, adk_config.py e agents/bug_finder/agent.py delegam para
+bootstrap(), que carrega o ambiente e cria o agente uma única vez por processo,
+independente de quantos desses módulos forem importados.
+"""
+
+import os
+from functools import lru_cache
+
+from .config.settings import load_environment
+
+
+@lru_cache(maxsize=1)
+def bootstrap():
+    """Carrega o .env, valida a API key e retorna o agente ADK (singleton)."""
+    # Carregar variáveis de ambiente do .env ANTES de qualquer import
+    # (variáveis já injetadas pelo ambiente de execução têm precedência)
+    load_environment()
+
+    # Verificar se a API key foi carregada corretamente
+    if not os.getenv('GOOGLE_AI_API_KEY'):
+        raise ValueError("GOOGLE_AI_API_KEY not found! Make sure .env file exists and contains the API key.")
+
+    # Import tardio para que as configurações leiam o ambiente já carregado
+    from .agents import create_agent
+
+    return create_agent()
@@ -0,0 +1,7 @@
+from .analysis_cache import AnalysisCache, get_analysis_cache, reset_analysis_cache
+
+__all__ = [
+    "AnalysisCache",
+    "get_analysis_cache",
+    "reset_analysis_cache"
+]
@@ -0,0 +1,93 @@
+import hashlib
+import threading
+from typing import Optional, Dict, Any
+
+from cachetools import Cache, LRUCache, TTLCache
+
+from ..config import get_settings
+from ..models import AnalysisResult, TIMESTAMP_RE
+
+
+class AnalysisCache:
+    """
+    Cache em memória de resultados de análise, indexado pelo conteúdo do log.
+    Timestamps são normalizados antes do hash, então repetições do mesmo erro
+    (ex: a mesma stack trace milhares de vezes durante um incidente) reaproveitam
+    a análise em vez de disparar novas chamadas à IA. Com ttl_seconds > 0 as
+    entradas expiram, para que um erro recorrente volte a ser reavaliado.
+    """
+    
+    def __init__(self, maxsize: int = 4096, ttl_seconds: float = 0):
+        if ttl_seconds > 0:
+            self._cache: Cache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        else:
+            self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(raw_log: str) -> str:
+        normalized = TIMESTAMP_RE.sub("<TS>", raw_log.strip())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    
+    def get(self, raw_log: str) -> Optional[AnalysisResult]:
+        """Retorna uma cópia do resultado em cache, ou None."""
+        key = self.make_key(raw_log)
+        with self._lock:
+            result = self._cache.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return result.model_copy(deep=True)
+    
+    def put(self, raw_log: str, result: AnalysisResult) -> None:
+        key = self.make_key(raw_log)
+        with self._lock:
+            self._cache[key] = result.model_copy(deep=True)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna tamanho, hits, misses e taxa de acerto do cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "max_size": self._cache.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": f"{(self.hits / max(lookups, 1) * 100):.1f}%"
+            }
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+# Global cache instance
+_analysis_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    global _analysis_cache
+    if _analysis_cache is None:
+        settings = get_settings()
+        _analysis_cache = AnalysisCache(
+            maxsize=settings.analysis_cache_size,
+            ttl_seconds=settings.analysis_cache_ttl_seconds
+        )
+    return _analysis_cache
+
+
+def reset_analysis_cache() -> None:
+    """Descarta as análises em cache; a próxima chamada a get_analysis_cache() cria um novo cache."""
+    global _analysis_cache
+    if _analysis_cache is not None:
+        _analysis_cache.clear()
+    _analysis_cache = None
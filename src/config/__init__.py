@@ -1,14 +1,21 @@
-from .settings import BugFinderSettings, get_settings, reload_settings, Environment, LogLevel
-from .prompts import get_prompt, get_available_agents, validate_prompt_parameters, AGENT_PROMPTS
+from .settings import BugFinderSettings, get_settings, reload_settings, load_environment, get_genai_client, Environment, LogLevel
+from .prompts import (
+    get_prompt, get_available_agents, validate_prompt_parameters, truncate_for_prompt,
+    AGENT_PROMPTS, MAX_PROMPT_INPUT_CHARS
+)
 
 __all__ = [
     "BugFinderSettings",
     "get_settings", 
     "reload_settings",
+    "load_environment",
+    "get_genai_client",
     "Environment",
     "LogLevel",
     "get_prompt",
     "get_available_agents", 
     "validate_prompt_parameters",
-    "AGENT_PROMPTS"
+    "truncate_for_prompt",
+    "AGENT_PROMPTS",
+    "MAX_PROMPT_INPUT_CHARS"
 ]
\ No newline at end of file
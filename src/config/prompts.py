@@ -1,4 +1,7 @@
-from typing import Dict, Any
+import re
+import string
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 
 # Prompts para o BugAnalyserAgent
@@ -430,6 +433,82 @@ Processe e estruture o log recebido, extraindo todas as informações relevantes
 Seja preciso na extração e estruturação dos dados do log.
 """
 
+# Prompt combinado (LogReceiver + BugAnalyser) usado para extrair e analisar o log em uma única chamada
+LOG_ANALYSER_PROMPT = """
+Você é um especialista em processamento de logs e análise de bugs. Sua função é estruturar o log bruto recebido e, na mesma resposta, determinar se ele representa um bug real que precisa de atenção.
+
+## Log Bruto Recebido:
+{raw_log}
+
+## Parte 1 - Estruturação do Log:
+Extraia timestamp, nível (DEBUG, INFO, WARNING, ERROR, CRITICAL), mensagem principal, origem, função, linha, stack trace, IDs de contexto (usuário, sessão, requisição) e dados adicionais relevantes.
+- Verifique se é um formato de log válido
+- Extraia informações mesmo de logs mal formatados
+
+## Parte 2 - Análise do Bug:
+Com base no log estruturado, determine:
+
+### É um Bug Real?
+- Erros de sintaxe, runtime, exceções não tratadas = SIM
+- Mensagens informativas, warnings normais = NÃO
+- Falhas de conectividade temporárias = DEPENDE do contexto
+
+### Severidade:
+- **CRITICAL**: Sistema inoperante, perda de dados, falhas de segurança
+- **HIGH**: Funcionalidades principais quebradas, muitos usuários afetados
+- **MEDIUM**: Funcionalidades secundárias afetadas, poucos usuários
+- **LOW**: Problemas cosméticos, edge cases
+
+### Categoria e Impacto:
+- Classifique o tipo de erro pela stack trace e mensagem (syntax_error, runtime_error, network_error, database_error, etc.)
+- Avalie usuários afetados, bloqueio de funcionalidades críticas e riscos de segurança ou dados (user_blocking, feature_degradation, performance_impact, etc.)
+
+### Decisão:
+- **create_issue**: Para bugs reais que precisam correção
+- **monitor**: Para problemas que precisam observação
+- **ignore**: Para logs informativos ou falsos positivos
+
+Se o log não for válido, retorne "is_valid": false e omita "bug_analysis".
+
+## Responda em JSON:
+```json
+{{
+    "is_valid": true/false,
+    "validation_errors": ["erro1", "erro2"],
+    "parsed_log": {{
+        "timestamp": "ISO datetime",
+        "level": "ERROR|WARNING|INFO|DEBUG|CRITICAL",
+        "message": "mensagem principal",
+        "source": "origem do log",
+        "function_name": "nome da função",
+        "line_number": numero_da_linha,
+        "stack_trace": "stack trace completo",
+        "user_id": "ID do usuário",
+        "session_id": "ID da sessão",
+        "request_id": "ID da requisição",
+        "additional_data": {{
+            "campo1": "valor1"
+        }}
+    }},
+    "bug_analysis": {{
+        "is_bug": true/false,
+        "severity": "low|medium|high|critical",
+        "category": "categoria_do_bug",
+        "impact": "tipo_de_impacto",
+        "decision": "create_issue|monitor|ignore",
+        "confidence_score": 0.0-1.0,
+        "root_cause_hypothesis": "hipótese da causa raiz",
+        "affected_components": ["componente1", "componente2"],
+        "reproduction_likelihood": 0.0-1.0,
+        "priority_score": 0-100,
+        "analysis_notes": "notas adicionais sobre a análise"
+    }}
+}}
+```
+
+Seja preciso na extração e baseie sua análise em evidências do log.
+"""
+
 # Prompt para o BugFinderAgent (Maestro)
 BUG_FINDER_MASTER_PROMPT = """
 Você é o coordenador principal do sistema Bug Finder. Sua função é orquestrar todo o processo de análise de bugs e criação de issues.
@@ -489,10 +568,43 @@ AGENT_PROMPTS = {
     "issue_refiner": ISSUE_REFINER_PROMPT,
     "issue_notificator": ISSUE_NOTIFICATOR_PROMPT,
     "log_receiver": LOG_RECEIVER_PROMPT,
+    "log_analyser": LOG_ANALYSER_PROMPT,
     "bug_finder_master": BUG_FINDER_MASTER_PROMPT
 }
 
 
+_TEMPLATE_VARIABLE_RE = re.compile(r'\{(\w+)\}')
+
+# Limite de texto bruto interpolado nos prompts: início e fim do log,
+# onde ficam a mensagem e a exceção final
+_PROMPT_HEAD_CHARS = 8192
+_PROMPT_TAIL_CHARS = 2048
+MAX_PROMPT_INPUT_CHARS = _PROMPT_HEAD_CHARS + _PROMPT_TAIL_CHARS
+
+
+def truncate_for_prompt(text: str, head: int = _PROMPT_HEAD_CHARS, tail: int = _PROMPT_TAIL_CHARS) -> str:
+    """Limita textos enormes (ex.: stack traces de MBs) ao início e ao fim antes de ir para o prompt."""
+    if len(text) <= head + tail:
+        return text
+    return text[:head] + "\n...[truncated]...\n" + text[-tail:]
+
+
+@lru_cache(maxsize=None)
+def _parse_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Pré-processa um template em pares (texto literal, nome do campo) uma única vez.
+    
+    Retorna None se o template usar recursos que exigem str.format
+    (especificadores de formato, conversões ou acesso a atributos/índices).
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
 def get_prompt(agent_name: str, **kwargs) -> str:
     """
     Obtém o prompt para um agente específico e formata com os argumentos fornecidos.
@@ -508,9 +620,16 @@ def get_prompt(agent_name: str, **kwargs) -> str:
         raise ValueError(f"Prompt não encontrado para o agente: {agent_name}")
     
     prompt_template = AGENT_PROMPTS[agent_name]
+    segments = _parse_template(prompt_template)
     
     try:
-        return prompt_template.format(**kwargs)
+        if segments is None:
+            return prompt_template.format(**kwargs)
+        # Monta o prompt a partir dos segmentos já parseados, sem reprocessar o template
+        return "".join([
+            literal if field_name is None else literal + str(kwargs[field_name])
+            for literal, field_name in segments
+        ])
     except KeyError as e:
         raise ValueError(f"Parâmetro obrigatório ausente para o prompt do agente {agent_name}: {e}")
 
@@ -533,12 +652,6 @@ def validate_prompt_parameters(agent_name: str, **kwargs) -> list:
     prompt_template = AGENT_PROMPTS[agent_name]
     
     # Extrair variáveis do template
-    import re
-    variables = re.findall(r'\{(\w+)\}', prompt_template)
-    
-    missing_params = []
-    for var in variables:
-        if var not in kwargs:
-            missing_params.append(var)
+    variables = _TEMPLATE_VARIABLE_RE.findall(prompt_template)
     
-    return missing_params
\ No newline at end of file
+    return [var for var in variables if var not in kwargs]
\ No newline at end of file
@@ -1,11 +1,21 @@
 import os
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 from enum import Enum
 from dotenv import load_dotenv
 
+# Caminho explícito do .env na raiz do projeto (evita a busca do find_dotenv)
+DOTENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+
+def load_environment() -> None:
+    """Carrega o .env sem sobrescrever variáveis já injetadas no ambiente."""
+    load_dotenv(dotenv_path=DOTENV_PATH, override=False)
+
+
 # Carregar variáveis do arquivo .env
-load_dotenv()
+load_environment()
 
 
 class Environment(str, Enum):
@@ -22,6 +32,21 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+def _clean_env(key: str, default: str = "") -> str:
+    """Lê uma variável de ambiente, removendo comentários inline (# ...) e espaços."""
+    value = os.getenv(key, default)
+    return value.partition('#')[0].strip() if value else default
+
+
+# Campos obrigatórios e a variável de ambiente correspondente
+_REQUIRED_SETTINGS = (
+    ("github_access_token", "GITHUB_ACCESS_TOKEN"),
+    ("google_ai_api_key", "GOOGLE_AI_API_KEY"),
+    ("github_repository_owner", "GITHUB_REPOSITORY_OWNER"),
+    ("github_repository_name", "GITHUB_REPOSITORY_NAME"),
+)
+
+
 class BugFinderSettings(BaseModel):
     # Environment
     environment: Environment = Field(
@@ -58,6 +83,10 @@ class BugFinderSettings(BaseModel):
     max_processing_time_minutes: int = Field(default=10, description="Maximum processing time per log")
     enable_parallel_processing: bool = Field(default=False, description="Enable parallel processing of logs")
     max_parallel_workers: int = Field(default=3, description="Maximum parallel workers")
+    enable_analysis_cache: bool = Field(default=True, description="Reuse analyses of repeated logs")
+    analysis_cache_size: int = Field(default=4096, description="Maximum cached analyses")
+    analysis_cache_ttl_seconds: int = Field(default=3600, description="Seconds before a cached analysis expires (0 = never)")
+    enable_fused_analysis: bool = Field(default=True, description="Extract and analyse each log in a single AI call")
     
     # Analysis Configuration
     minimum_confidence_score: float = Field(default=0.7, description="Minimum confidence to create issue")
@@ -79,6 +108,7 @@ class BugFinderSettings(BaseModel):
     github_rate_limit_buffer: int = Field(default=100, description="GitHub rate limit buffer")
     discord_rate_limit_per_minute: int = Field(default=30, description="Discord rate limit per minute")
     ai_requests_per_minute: int = Field(default=60, description="AI requests per minute limit")
+    ai_max_concurrency: int = Field(default=10, description="Maximum concurrent AI requests in batch analysis")
     
     # Logging Configuration
     log_level: LogLevel = Field(default=LogLevel.INFO, description="Logging level")
@@ -97,85 +127,77 @@ class BugFinderSettings(BaseModel):
     
     @classmethod
     def from_env(cls) -> "BugFinderSettings":
-        # Helper function to clean environment values
-        def clean_env(key: str, default: str = "") -> str:
-            value = os.getenv(key, default)
-            return value.split('#')[0].strip() if value else default
-        
         return cls(
-            environment=Environment(clean_env("ENVIRONMENT", "development")),
-            debug_mode=clean_env("DEBUG_MODE", "true").lower() == "true",
+            environment=Environment(_clean_env("ENVIRONMENT", "development")),
+            debug_mode=_clean_env("DEBUG_MODE", "true").lower() == "true",
             
             # Required API keys
-            github_access_token=clean_env("GITHUB_ACCESS_TOKEN"),
-            google_ai_api_key=clean_env("GOOGLE_AI_API_KEY"),
-            discord_webhook_url=clean_env("DISCORD_WEBHOOK_URL") or None,
+            github_access_token=_clean_env("GITHUB_ACCESS_TOKEN"),
+            google_ai_api_key=_clean_env("GOOGLE_AI_API_KEY"),
+            discord_webhook_url=_clean_env("DISCORD_WEBHOOK_URL") or None,
             
             # GitHub settings
-            github_repository_owner=clean_env("GITHUB_REPOSITORY_OWNER"),
-            github_repository_name=clean_env("GITHUB_REPOSITORY_NAME"),
-            github_default_labels=[l.strip() for l in clean_env("GITHUB_DEFAULT_LABELS", "bug,auto-generated").split(",")],
-            github_default_assignees=[a.strip() for a in clean_env("GITHUB_DEFAULT_ASSIGNEES").split(",") if a.strip()],
+            github_repository_owner=_clean_env("GITHUB_REPOSITORY_OWNER"),
+            github_repository_name=_clean_env("GITHUB_REPOSITORY_NAME"),
+            github_default_labels=[l.strip() for l in _clean_env("GITHUB_DEFAULT_LABELS", "bug,auto-generated").split(",")],
+            github_default_assignees=[a.strip() for a in _clean_env("GITHUB_DEFAULT_ASSIGNEES").split(",") if a.strip()],
             
             # Google AI settings
-            gemini_model=clean_env("GEMINI_MODEL", "gemini-1.5-pro"),
-            gemini_temperature=float(clean_env("GEMINI_TEMPERATURE", "0.1")),
-            gemini_max_tokens=int(clean_env("GEMINI_MAX_TOKENS", "8192")),
-            gemini_timeout_seconds=int(clean_env("GEMINI_TIMEOUT_SECONDS", "30")),
+            gemini_model=_clean_env("GEMINI_MODEL", "gemini-1.5-pro"),
+            gemini_temperature=float(_clean_env("GEMINI_TEMPERATURE", "0.1")),
+            gemini_max_tokens=int(_clean_env("GEMINI_MAX_TOKENS", "8192")),
+            gemini_timeout_seconds=int(_clean_env("GEMINI_TIMEOUT_SECONDS", "30")),
             
             # Processing settings
-            max_log_size_mb=float(clean_env("MAX_LOG_SIZE_MB", "10.0")),
-            max_processing_time_minutes=int(clean_env("MAX_PROCESSING_TIME_MINUTES", "10")),
-            enable_parallel_processing=clean_env("ENABLE_PARALLEL_PROCESSING", "false").lower() == "true",
-            max_parallel_workers=int(clean_env("MAX_PARALLEL_WORKERS", "3")),
+            max_log_size_mb=float(_clean_env("MAX_LOG_SIZE_MB", "10.0")),
+            max_processing_time_minutes=int(_clean_env("MAX_PROCESSING_TIME_MINUTES", "10")),
+            enable_parallel_processing=_clean_env("ENABLE_PARALLEL_PROCESSING", "false").lower() == "true",
+            max_parallel_workers=int(_clean_env("MAX_PARALLEL_WORKERS", "3")),
+            enable_analysis_cache=_clean_env("ENABLE_ANALYSIS_CACHE", "true").lower() == "true",
+            analysis_cache_size=int(_clean_env("ANALYSIS_CACHE_SIZE", "4096")),
+            analysis_cache_ttl_seconds=int(_clean_env("ANALYSIS_CACHE_TTL_SECONDS", "3600")),
+            enable_fused_analysis=_clean_env("ENABLE_FUSED_ANALYSIS", "true").lower() == "true",
             
             # Analysis settings
-            minimum_confidence_score=float(clean_env("MINIMUM_CONFIDENCE_SCORE", "0.7")),
-            enable_duplicate_detection=clean_env("ENABLE_DUPLICATE_DETECTION", "true").lower() == "true",
-            duplicate_similarity_threshold=float(clean_env("DUPLICATE_SIMILARITY_THRESHOLD", "0.8")),
+            minimum_confidence_score=float(_clean_env("MINIMUM_CONFIDENCE_SCORE", "0.7")),
+            enable_duplicate_detection=_clean_env("ENABLE_DUPLICATE_DETECTION", "true").lower() == "true",
+            duplicate_similarity_threshold=float(_clean_env("DUPLICATE_SIMILARITY_THRESHOLD", "0.8")),
             
             # Issue creation settings
-            max_issue_creation_retries=int(clean_env("MAX_ISSUE_CREATION_RETRIES", "3")),
-            issue_creation_retry_delay_seconds=int(clean_env("ISSUE_CREATION_RETRY_DELAY_SECONDS", "5")),
-            enable_issue_review=clean_env("ENABLE_ISSUE_REVIEW", "true").lower() == "true",
-            max_review_iterations=int(clean_env("MAX_REVIEW_ITERATIONS", "2")),
+            max_issue_creation_retries=int(_clean_env("MAX_ISSUE_CREATION_RETRIES", "3")),
+            issue_creation_retry_delay_seconds=int(_clean_env("ISSUE_CREATION_RETRY_DELAY_SECONDS", "5")),
+            enable_issue_review=_clean_env("ENABLE_ISSUE_REVIEW", "true").lower() == "true",
+            max_review_iterations=int(_clean_env("MAX_REVIEW_ITERATIONS", "2")),
             
             # Notification settings
-            enable_discord_notifications=clean_env("ENABLE_DISCORD_NOTIFICATIONS", "true").lower() == "true",
-            notification_retry_attempts=int(clean_env("NOTIFICATION_RETRY_ATTEMPTS", "3")),
-            notification_retry_delay_seconds=int(clean_env("NOTIFICATION_RETRY_DELAY_SECONDS", "10")),
+            enable_discord_notifications=_clean_env("ENABLE_DISCORD_NOTIFICATIONS", "true").lower() == "true",
+            notification_retry_attempts=int(_clean_env("NOTIFICATION_RETRY_ATTEMPTS", "3")),
+            notification_retry_delay_seconds=int(_clean_env("NOTIFICATION_RETRY_DELAY_SECONDS", "10")),
             
             # Rate limiting
-            github_rate_limit_buffer=int(clean_env("GITHUB_RATE_LIMIT_BUFFER", "100")),
-            discord_rate_limit_per_minute=int(clean_env("DISCORD_RATE_LIMIT_PER_MINUTE", "30")),
-            ai_requests_per_minute=int(clean_env("AI_REQUESTS_PER_MINUTE", "60")),
+            github_rate_limit_buffer=int(_clean_env("GITHUB_RATE_LIMIT_BUFFER", "100")),
+            discord_rate_limit_per_minute=int(_clean_env("DISCORD_RATE_LIMIT_PER_MINUTE", "30")),
+            ai_requests_per_minute=int(_clean_env("AI_REQUESTS_PER_MINUTE", "60")),
+            ai_max_concurrency=int(_clean_env("AI_MAX_CONCURRENCY", "10")),
             
             # Logging
-            log_level=LogLevel(clean_env("LOG_LEVEL", "INFO")),
-            log_file_path=clean_env("LOG_FILE_PATH") or None,
-            enable_structured_logging=clean_env("ENABLE_STRUCTURED_LOGGING", "true").lower() == "true",
-            log_retention_days=int(clean_env("LOG_RETENTION_DAYS", "30")),
+            log_level=LogLevel(_clean_env("LOG_LEVEL", "INFO")),
+            log_file_path=_clean_env("LOG_FILE_PATH") or None,
+            enable_structured_logging=_clean_env("ENABLE_STRUCTURED_LOGGING", "true").lower() == "true",
+            log_retention_days=int(_clean_env("LOG_RETENTION_DAYS", "30")),
             
             # System
-            system_version=clean_env("SYSTEM_VERSION", "1.0.0"),
-            enable_metrics=clean_env("ENABLE_METRICS", "true").lower() == "true",
-            metrics_retention_days=int(clean_env("METRICS_RETENTION_DAYS", "90"))
+            system_version=_clean_env("SYSTEM_VERSION", "1.0.0"),
+            enable_metrics=_clean_env("ENABLE_METRICS", "true").lower() == "true",
+            metrics_retention_days=int(_clean_env("METRICS_RETENTION_DAYS", "90"))
         )
     
     def validate_required_settings(self) -> List[str]:
-        errors = []
-        
-        if not self.github_access_token:
-            errors.append("GITHUB_ACCESS_TOKEN is required")
-        
-        if not self.google_ai_api_key:
-            errors.append("GOOGLE_AI_API_KEY is required")
-        
-        if not self.github_repository_owner:
-            errors.append("GITHUB_REPOSITORY_OWNER is required")
-        
-        if not self.github_repository_name:
-            errors.append("GITHUB_REPOSITORY_NAME is required")
+        errors = [
+            f"{env_var} is required"
+            for field_name, env_var in _REQUIRED_SETTINGS
+            if not getattr(self, field_name)
+        ]
         
         if self.enable_discord_notifications and not self.discord_webhook_url:
             errors.append("DISCORD_WEBHOOK_URL is required when Discord notifications are enabled")
@@ -217,6 +239,40 @@ def get_settings() -> BugFinderSettings:
 
 
 def reload_settings() -> BugFinderSettings:
-    global _settings
+    global _settings, _genai_client
     _settings = BugFinderSettings.from_env()
-    return _settings
\ No newline at end of file
+    
+    # Análises em cache podem ter sido geradas com outro modelo/configuração
+    from ..cache import reset_analysis_cache
+    reset_analysis_cache()
+    
+    # API key/timeout podem ter mudado; o cliente é recriado no próximo uso
+    # (os agentes buscam o cliente a cada chamada). Modelo e generation config
+    # continuam os lidos na criação de cada agente.
+    _genai_client = None
+    
+    return _settings
+
+
+# Cliente do Google AI compartilhado (criado sob demanda)
+_genai_client = None
+
+
+def get_genai_client():
+    """
+    Retorna o cliente google-genai, criado uma única vez e apenas quando for necessário.
+    Todos os agentes compartilham o mesmo cliente e, portanto, o mesmo pool de
+    conexões HTTP (keep-alive), sem novo handshake TLS a cada chamada.
+    """
+    global _genai_client
+    if _genai_client is None:
+        from google import genai
+        from google.genai import types
+        
+        settings = get_settings()
+        _genai_client = genai.Client(
+            api_key=settings.google_ai_api_key,
+            # HttpOptions.timeout é em milissegundos
+            http_options=types.HttpOptions(timeout=settings.gemini_timeout_seconds * 1000)
+        )
+    return _genai_client
@@ -1,4 +1,4 @@
-from .log_model import LogModel, LogLevel, ProcessedLog
+from .log_model import LogModel, LogLevel, ProcessedLog, TIMESTAMP_RE
 from .bug_analysis import (
     BugAnalysis, 
     BugSeverity, 
@@ -50,6 +50,7 @@ __all__ = [
     "LogModel",
     "LogLevel", 
     "ProcessedLog",
+    "TIMESTAMP_RE",
     
     # Bug analysis models
     "BugAnalysis",
@@ -45,6 +45,11 @@ class AnalysisDecision(str, Enum):
     IGNORE = "ignore"
 
 
+# Conjuntos constantes usados nas verificações de prioridade
+_HIGH_PRIORITY_SEVERITIES = frozenset({BugSeverity.HIGH, BugSeverity.CRITICAL})
+_IMMEDIATE_ATTENTION_IMPACTS = frozenset({BugImpact.USER_BLOCKING, BugImpact.SECURITY_RISK, BugImpact.DATA_INTEGRITY})
+
+
 class BugAnalysis(BaseModel):
     log_id: str = Field(..., description="ID único do log analisado")
     analysis_timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp da análise")
@@ -82,12 +87,12 @@ class BugAnalysis(BaseModel):
         return self.decision == AnalysisDecision.CREATE_ISSUE
     
     def is_high_priority(self) -> bool:
-        return self.priority_score >= 70.0 or self.severity in [BugSeverity.HIGH, BugSeverity.CRITICAL]
+        return self.priority_score >= 70.0 or self.severity in _HIGH_PRIORITY_SEVERITIES
     
     def requires_immediate_attention(self) -> bool:
         return (
             self.severity == BugSeverity.CRITICAL or
-            self.impact in [BugImpact.USER_BLOCKING, BugImpact.SECURITY_RISK, BugImpact.DATA_INTEGRITY] or
+            self.impact in _IMMEDIATE_ATTENTION_IMPACTS or
             self.priority_score >= 90.0
         )
     
@@ -67,6 +67,9 @@ class IssueLabel(str, Enum):
     AUTO_GENERATED = "auto-generated"
 
 
+_REVIEW_PENDING_STATUSES = frozenset({IssueStatus.DRAFT, IssueStatus.NEEDS_REFINEMENT})
+
+
 class IssueDraft(BaseModel):
     title: str = Field(..., description="Título da issue")
     description: str = Field(..., description="Descrição detalhada da issue")
@@ -346,7 +349,7 @@ class IssueModel(BaseModel):
         return self.status == IssueStatus.APPROVED
     
     def needs_review(self) -> bool:
-        return self.status in [IssueStatus.DRAFT, IssueStatus.NEEDS_REFINEMENT]
+        return self.status in _REVIEW_PENDING_STATUSES
     
     def get_issue_summary(self) -> Dict[str, Any]:
         return {
@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
@@ -12,6 +13,9 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+_ERROR_LEVELS = frozenset({LogLevel.ERROR, LogLevel.CRITICAL})
+
+
 class LogModel(BaseModel):
     timestamp: datetime = Field(..., description="Timestamp do log")
     level: LogLevel = Field(..., description="Nível do log")
@@ -31,7 +35,7 @@ class LogModel(BaseModel):
         }
         
     def is_error(self) -> bool:
-        return self.level in [LogLevel.ERROR, LogLevel.CRITICAL]
+        return self.level in _ERROR_LEVELS
     
     def is_critical(self) -> bool:
         return self.level == LogLevel.CRITICAL
@@ -58,10 +62,17 @@ class LogModel(BaseModel):
             context["session_id"] = self.session_id
         if self.request_id:
             context["request_id"] = self.request_id
-        if self.additional_data:
-            context["additional_data"] = self.additional_data
+        additional_data = self.get_prompt_additional_data()
+        if additional_data:
+            context["additional_data"] = additional_data
             
         return context
+    
+    def get_prompt_additional_data(self) -> Optional[Dict[str, Any]]:
+        """additional_data sem raw_input (o log original completo, guardado só para inspeção)."""
+        if not self.additional_data:
+            return None
+        return {key: value for key, value in self.additional_data.items() if key != "raw_input"} or None
 
 
 class ProcessedLog(BaseModel):
@@ -72,4 +83,8 @@ class ProcessedLog(BaseModel):
     validation_errors: Optional[List[str]] = Field(None, description="Erros de validação, se houver")
     
     def has_errors(self) -> bool:
-        return not self.is_valid or (self.validation_errors and len(self.validation_errors) > 0)
\ No newline at end of file
+        return not self.is_valid or (self.validation_errors and len(self.validation_errors) > 0)
+
+
+# Timestamp ISO (data e hora) no texto do log; também usado para normalizar a chave do cache
+TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?")
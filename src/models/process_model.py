@@ -25,6 +25,9 @@ class ProcessStatus(str, Enum):
     FAILED = "failed"
 
 
+_TERMINAL_STATUSES = frozenset({ProcessStatus.FAILED, ProcessStatus.COMPLETED, ProcessStatus.ANALYSIS_REJECTED})
+
+
 class ProcessStep(BaseModel):
     step_name: str = Field(..., description="Nome da etapa")
     agent_name: str = Field(..., description="Nome do agente responsável")
@@ -126,7 +129,7 @@ class BugFinderProcess(BaseModel):
         self.notifications.append(notification)
     
     def should_continue(self) -> bool:
-        return self.status not in [ProcessStatus.FAILED, ProcessStatus.COMPLETED, ProcessStatus.ANALYSIS_REJECTED]
+        return self.status not in _TERMINAL_STATUSES
     
     def has_failed(self) -> bool:
         return self.status == ProcessStatus.FAILED
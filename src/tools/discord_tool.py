@@ -16,6 +16,10 @@ class DiscordTool:
         self.rate_limit_per_minute = 30
         self.rate_limit_window = 60  # seconds
         self.request_timestamps = []
+        
+        # Sessão HTTP reutilizada entre chamadas (keep-alive evita novo handshake TLS)
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
     
     def _check_rate_limit(self) -> bool:
         current_time = time.time()
@@ -71,11 +75,10 @@ class DiscordTool:
             self.logger.info(f"Sending Discord notification: {discord_data.embed_title or 'Message'}")
             
             # Send request
-            response = requests.post(
+            response = self.session.post(
                 webhook_url,
                 json=payload,
-                timeout=30,
-                headers={"Content-Type": "application/json"}
+                timeout=30
             )
             
             # Check response
@@ -244,7 +247,7 @@ class DiscordTool:
                 
                 # Get webhook info (without token for security)
                 info_url = f"https://discord.com/api/webhooks/{webhook_id}"
-                response = requests.get(info_url, timeout=10)
+                response = self.session.get(info_url, timeout=10)
                 
                 if response.status_code == 200:
                     data = response.json()
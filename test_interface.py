@@ -4,10 +4,6 @@ Script para testar rapidamente o Bug Finder com logs de exemplo.
 """
 
 import sys
-from pathlib import Path
-
-# Adicionar src ao path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 # Logs de exemplo simples para a interface
 SIMPLE_LOGS = [
@@ -19,15 +15,22 @@ SIMPLE_LOGS = [
     "INFO: User login successful - alice@company.com"
 ]
 
-print("🧪 LOGS SIMPLES PARA TESTAR NA INTERFACE WEB")
-print("=" * 60)
-print("Cole estes logs na interface: http://localhost:8000")
-print("=" * 60)
+SEPARATOR = "=" * 60
 
-for i, log in enumerate(SIMPLE_LOGS, 1):
-    print(f"\n{i}. {log}")
+# Monta toda a saída e escreve de uma vez só
+lines = [
+    "🧪 LOGS SIMPLES PARA TESTAR NA INTERFACE WEB",
+    SEPARATOR,
+    "Cole estes logs na interface: http://localhost:8000",
+    SEPARATOR,
+]
+lines.extend(f"\n{i}. {log}" for i, log in enumerate(SIMPLE_LOGS, 1))
+lines += [
+    "\n" + SEPARATOR,
+    "💡 DICA: Use o log #1 ou #5 para ver bugs críticos sendo detectados!",
+    "💡 Use o log #6 para ver como logs informativos são ignorados.",
+    SEPARATOR,
+]
 
-print("\n" + "=" * 60)
-print("💡 DICA: Use o log #1 ou #5 para ver bugs críticos sendo detectados!")
-print("💡 Use o log #6 para ver como logs informativos são ignorados.")
-print("=" * 60)
\ No newline at end of file
+sys.stdout.write("\n".join(lines) + "\n")
+sys.stdout.flush()
@@ -0,0 +1,104 @@
+"""Fixtures dos testes unitários: ambiente mínimo e um cliente google-genai falso."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import reload_settings
+
+
+_TEST_ENV = {
+    "GOOGLE_AI_API_KEY": "test-key",
+    "GITHUB_ACCESS_TOKEN": "test-token",
+    "GITHUB_REPOSITORY_OWNER": "owner",
+    "GITHUB_REPOSITORY_NAME": "repo",
+    "ENABLE_ANALYSIS_CACHE": "true",
+    "ENABLE_FUSED_ANALYSIS": "true",
+}
+
+
+class FakeBatches:
+    """Batch API falsa: o job passa por `states` a cada consulta e termina com `responses`."""
+
+    def __init__(self):
+        self.states = ["JOB_STATE_RUNNING", "JOB_STATE_SUCCEEDED"]
+        self.responses = []
+        self.requests = []
+        self.jobs = 0
+        self.polls = 0
+
+    async def create(self, model, src, config):
+        self.jobs += 1
+        self.requests = list(src)
+        return self._job("JOB_STATE_PENDING")
+
+    async def get(self, name):
+        state = self.states[min(self.polls, len(self.states) - 1)]
+        self.polls += 1
+        return self._job(state)
+
+    def _job(self, state):
+        return SimpleNamespace(
+            name="batches/test",
+            state=SimpleNamespace(name=state),
+            dest=SimpleNamespace(inlined_responses=self.responses)
+        )
+
+
+class FakeGenaiClient:
+    """
+    Cliente falso com a mesma interface usada pelos agentes.
+    Cada chamada registra o prompt e devolve a próxima resposta de `responses`,
+    ou o retorno de `respond(prompt)` quando definido. Exceções são lançadas.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.respond = None
+        self.prompts = []
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+        self.aio = SimpleNamespace(
+            models=SimpleNamespace(generate_content=self._generate_content_async),
+            batches=FakeBatches()
+        )
+
+    def _reply(self, contents):
+        self.prompts.append(contents)
+        reply = self.respond(contents) if self.respond else self.responses.pop(0)
+        if isinstance(reply, BaseException):
+            raise reply
+        return SimpleNamespace(text=reply)
+
+    def _generate_content(self, model, contents, config):
+        return self._reply(contents)
+
+    async def _generate_content_async(self, model, contents, config):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._reply(contents)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def test_settings(monkeypatch):
+    """Configurações recarregadas a partir de um ambiente de teste conhecido."""
+    for key, value in _TEST_ENV.items():
+        monkeypatch.setenv(key, value)
+    yield reload_settings()
+    monkeypatch.undo()
+    reload_settings()
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Substitui o cliente compartilhado de todos os agentes pelo FakeGenaiClient."""
+    client = FakeGenaiClient()
+    for module in ("bug_analyser_agent", "issue_manager_agent", "notification_agent"):
+        monkeypatch.setattr(f"src.agents.{module}.get_genai_client", lambda: client)
+    return client
@@ -0,0 +1,26 @@
+import pytest
+
+import src.agents as agents
+from src.agents.bug_analyser_agent import BugAnalyserAgent as DirectBugAnalyserAgent
+
+
+def test_lazy_import_resolves_and_caches(monkeypatch):
+    # Remove o valor já resolvido por outros testes para exercitar __getattr__
+    monkeypatch.delitem(vars(agents), "BugAnalyserAgent", raising=False)
+
+    from src.agents import BugAnalyserAgent
+
+    assert BugAnalyserAgent is DirectBugAnalyserAgent
+    assert vars(agents)["BugAnalyserAgent"] is DirectBugAnalyserAgent
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError, match="UnknownAgent"):
+        agents.UnknownAgent
+
+    with pytest.raises(ImportError):
+        from src.agents import UnknownAgent  # noqa: F401
+
+
+def test_dir_lists_lazy_exports():
+    assert set(agents.__all__) <= set(dir(agents))
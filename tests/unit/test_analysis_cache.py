@@ -0,0 +1,101 @@
+import json
+import time
+from datetime import datetime
+
+from src.agents.bug_analyser_agent import BugAnalyserAgent
+from src.cache import AnalysisCache, get_analysis_cache
+from src.config import reload_settings
+from src.models import (
+    AnalysisResult, BugAnalysis, BugSeverity, BugCategory, BugImpact,
+    AnalysisDecision, LogModel, LogLevel
+)
+
+
+LOG_AT_10H = "ERROR 2024-01-20 10:30:45 - app.py:142 - Database connection failed"
+LOG_AT_11H = "ERROR 2024-01-20 11:02:13 - app.py:142 - Database connection failed"
+
+
+def _result(message: str = "Database connection failed") -> AnalysisResult:
+    return AnalysisResult(
+        log=LogModel(timestamp=datetime.now(), level=LogLevel.ERROR, message=message),
+        analysis=BugAnalysis(
+            log_id="original",
+            is_bug=True,
+            severity=BugSeverity.HIGH,
+            category=BugCategory.DATABASE_ERROR,
+            impact=BugImpact.SYSTEM_STABILITY,
+            decision=AnalysisDecision.CREATE_ISSUE
+        ),
+        processing_time_ms=1.0
+    )
+
+
+def test_logs_differing_only_in_timestamp_share_an_entry():
+    cache = AnalysisCache()
+    cache.put(LOG_AT_10H, _result())
+
+    assert AnalysisCache.make_key(LOG_AT_10H) == AnalysisCache.make_key(LOG_AT_11H)
+    assert cache.get(LOG_AT_11H) is not None
+    assert cache.get("ERROR 2024-01-20 10:30:45 - app.py:142 - Disk full") is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_hit_returns_independent_copy_with_new_log_id(fake_client):
+    fake_client.responses = [json.dumps({
+        "is_valid": True,
+        "parsed_log": {"level": "ERROR", "message": "Database connection failed"},
+        "bug_analysis": {"is_bug": True, "severity": "high"},
+    })]
+    agent = BugAnalyserAgent()
+
+    first = agent.process_and_analyze_log(LOG_AT_10H)
+    second = agent.process_and_analyze_log(LOG_AT_11H)
+
+    assert len(fake_client.prompts) == 1
+    assert second.analysis.log_id != first.analysis.log_id
+    assert second.log.timestamp == datetime(2024, 1, 20, 11, 2, 13)
+
+    # Alterar o resultado devolvido não afeta o que está em cache
+    second.analysis.affected_components.append("mutated")
+    third = agent.process_and_analyze_log(LOG_AT_10H)
+    assert "mutated" not in third.analysis.affected_components
+    assert third.analysis.log_id not in (first.analysis.log_id, second.analysis.log_id)
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = AnalysisCache(maxsize=2)
+    cache.put("ERROR a", _result("a"))
+    cache.put("ERROR b", _result("b"))
+    cache.get("ERROR a")
+    cache.put("ERROR c", _result("c"))
+
+    assert cache.get("ERROR a") is not None
+    assert cache.get("ERROR b") is None
+    assert cache.get("ERROR c") is not None
+
+
+def test_ttl_expires_entries():
+    cache = AnalysisCache(maxsize=10, ttl_seconds=0.05)
+    cache.put("ERROR a", _result())
+    assert cache.get("ERROR a") is not None
+
+    time.sleep(0.1)
+    assert cache.get("ERROR a") is None
+
+
+def test_reload_settings_resets_cache(monkeypatch):
+    agent = BugAnalyserAgent()
+    old_cache = agent.analysis_cache
+    old_cache.put(LOG_AT_10H, _result())
+
+    reload_settings()
+
+    assert len(old_cache) == 0
+    assert agent.analysis_cache is get_analysis_cache()
+    assert agent.analysis_cache is not old_cache
+    assert agent.analysis_cache.get(LOG_AT_10H) is None
+
+    monkeypatch.setenv("ENABLE_ANALYSIS_CACHE", "false")
+    reload_settings()
+    assert agent.analysis_cache is None
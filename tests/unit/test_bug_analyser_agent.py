@@ -0,0 +1,275 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from google.genai import errors as genai_errors
+from tenacity import wait_none
+
+from src.agents import bug_analyser_agent
+from src.agents.bug_analyser_agent import BugAnalyserAgent
+from src.agents.issue_manager_agent import IssueManagerAgent
+from src.config import AGENT_PROMPTS, MAX_PROMPT_INPUT_CHARS, reload_settings
+from src.models import AnalysisDecision, BugCategory, BugImpact, BugSeverity, LogLevel
+
+
+BUG_ANALYSIS = {
+    "is_bug": True,
+    "severity": "high",
+    "category": "database_error",
+    "impact": "system_stability",
+    "decision": "create_issue",
+    "confidence_score": 0.9,
+    "priority_score": 0.8,
+}
+
+
+def _fused_response(bug_analysis=BUG_ANALYSIS, **parsed_log):
+    result = {
+        "is_valid": True,
+        "parsed_log": {"level": "ERROR", "message": "Database connection failed", **parsed_log},
+    }
+    if bug_analysis is not None:
+        result["bug_analysis"] = bug_analysis
+    return json.dumps(result)
+
+
+def _agent_of(prompt: str) -> str:
+    """Identifica qual template gerou o prompt pelo texto que precede o primeiro campo."""
+    return next(
+        agent_name for agent_name, template in AGENT_PROMPTS.items()
+        if prompt.startswith(template.split("{", 1)[0])
+    )
+
+
+def _echo_message(prompt: str) -> str:
+    """Responde com a última linha do log embutido no prompt, para conferir a ordem."""
+    log_line = prompt.split("## Log Bruto Recebido:")[1].strip().splitlines()[0]
+    return _fused_response(message=log_line)
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    monkeypatch.setattr(BugAnalyserAgent._generate_content_async.retry, "wait", wait_none())
+
+
+def test_async_batch_keeps_input_order_and_dedupes(fake_client):
+    fake_client.respond = _echo_message
+    raw_logs = ["a err", "b err", "a err", "c err"]
+
+    results = asyncio.run(BugAnalyserAgent().process_and_analyze_logs_async(raw_logs))
+
+    assert [result.log.message for result in results] == raw_logs
+    # Logs idênticos no mesmo lote geram uma única chamada ao modelo
+    assert len(fake_client.prompts) == 3
+    assert results[0].analysis.log_id != results[2].analysis.log_id
+
+
+def test_async_batch_respects_concurrency_limit(fake_client, monkeypatch):
+    monkeypatch.setenv("AI_MAX_CONCURRENCY", "2")
+    reload_settings()
+    fake_client.respond = _echo_message
+    fake_client.delay = 0.01
+
+    results = asyncio.run(
+        BugAnalyserAgent().process_and_analyze_logs_async([f"err {i}" for i in range(8)])
+    )
+
+    assert len(results) == 8
+    assert fake_client.max_in_flight == 2
+
+
+@pytest.mark.parametrize("transient_error", [
+    genai_errors.ClientError(429, {"error": {"code": 429, "message": "rate limited", "status": "RESOURCE_EXHAUSTED"}}),
+    httpx.ReadTimeout("timed out"),
+    TimeoutError(),
+])
+def test_async_analysis_retries_transient_errors(fake_client, no_retry_wait, transient_error):
+    fake_client.responses = [transient_error, _fused_response()]
+
+    [result] = asyncio.run(BugAnalyserAgent().process_and_analyze_logs_async(["a err"]))
+
+    assert len(fake_client.prompts) == 2
+    assert result.analysis.is_bug is True
+
+
+def test_async_analysis_does_not_retry_client_errors(fake_client, no_retry_wait):
+    fake_client.responses = [
+        genai_errors.ClientError(400, {"error": {"code": 400, "message": "bad request", "status": "INVALID_ARGUMENT"}})
+    ]
+
+    [result] = asyncio.run(BugAnalyserAgent().process_and_analyze_logs_async(["a err"]))
+
+    assert len(fake_client.prompts) == 1
+    assert result.analysis.is_bug is False
+
+
+def test_large_log_keeps_every_prompt_under_the_cap(fake_client, monkeypatch):
+    huge_log = "ERROR Database connection failed\n" + "  at db.connect(pool.py:42)\n" * 140_000
+    fake_client.responses = [
+        # Sem bug_analysis na resposta combinada -> força a chamada ao bug_analyser
+        _fused_response(bug_analysis=None, additional_data={"service": "api"}),
+        json.dumps(BUG_ANALYSIS),
+        "{}",
+    ]
+    drafter_params = {}
+    monkeypatch.setattr(
+        "src.agents.issue_manager_agent.get_prompt",
+        lambda agent_name, **kwargs: drafter_params.update(kwargs) or ""
+    )
+
+    result = BugAnalyserAgent().process_and_analyze_log(huge_log)
+    IssueManagerAgent()._create_issue_draft(result)
+
+    # O texto completo continua disponível para inspeção...
+    assert result.log.additional_data["raw_input"] == huge_log
+    assert result.log.get_error_context()["additional_data"] == {"service": "api"}
+    # ...mas não chega aos prompts do log_analyser, do bug_analyser e do issue_drafter
+    cap = MAX_PROMPT_INPUT_CHARS + len("\n...[truncated]...\n")
+    log_analyser_prompt, bug_analyser_prompt = fake_client.prompts[:2]
+    assert len(log_analyser_prompt) <= len(AGENT_PROMPTS["log_analyser"]) + cap
+    assert len(bug_analyser_prompt) <= len(AGENT_PROMPTS["bug_analyser"]) + cap
+    assert len(drafter_params["log_context"]) <= cap
+
+
+def _inlined(text=None, error=None):
+    response = SimpleNamespace(text=text) if text is not None else None
+    return SimpleNamespace(response=response, error=error)
+
+
+def _request_text(request) -> str:
+    return request["contents"][0]["parts"][0]["text"]
+
+
+@pytest.fixture
+def instant_polling(monkeypatch):
+    monkeypatch.setattr(bug_analyser_agent, "_BATCH_POLL_INITIAL_SECONDS", 0)
+
+
+def test_batch_job_maps_responses_back_to_input_order(fake_client, instant_polling):
+    batches = fake_client.aio.batches
+    batches.responses = [_inlined(_fused_response(message=log)) for log in ("a err", "b err", "c err")]
+    raw_logs = ["a err", "b err", "a err", "c err"]
+    agent = BugAnalyserAgent()
+
+    results = asyncio.run(agent.process_and_analyze_logs_batch(raw_logs))
+
+    assert [result.log.message for result in results] == raw_logs
+    assert all(result.analysis.is_bug for result in results)
+    # Um único job com os logs únicos, consultado até o estado final
+    assert batches.jobs == 1
+    assert [_request_text(request).count(log) for request, log in zip(batches.requests, ("a err", "b err", "c err"))] == [1, 1, 1]
+    assert batches.polls == 2
+    assert fake_client.prompts == []
+
+    # Resultados do batch vão para o cache: nada é reenviado
+    asyncio.run(agent.process_and_analyze_logs_batch(raw_logs))
+    assert batches.jobs == 1
+
+
+def test_batch_job_failed_state_returns_error_analyses(fake_client, instant_polling):
+    fake_client.aio.batches.states = ["JOB_STATE_FAILED"]
+    agent = BugAnalyserAgent()
+
+    results = asyncio.run(agent.process_and_analyze_logs_batch(["a err", "b err"]))
+
+    assert [result.log.message for result in results] == ["a err", "b err"]
+    for result in results:
+        assert result.analysis.is_bug is False
+        assert "JOB_STATE_FAILED" in result.analysis.analysis_notes
+    assert len(agent.analysis_cache) == 0
+
+
+def test_batch_item_errors_and_unusable_responses(fake_client, instant_polling):
+    fake_client.aio.batches.responses = [_inlined(error="blocked"), _inlined("not json")]
+    # Resposta inutilizável segue pelo fluxo online em duas etapas
+    fake_client.responses = [
+        json.dumps({"is_valid": True, "parsed_log": {"level": "ERROR", "message": "b err"}}),
+        json.dumps(BUG_ANALYSIS),
+    ]
+
+    blocked, fallback = asyncio.run(BugAnalyserAgent().process_and_analyze_logs_batch(["a err", "b err"]))
+
+    assert blocked.analysis.analysis_notes == "Analysis error: Batch request failed: blocked"
+    assert fallback.log.message == "b err"
+    assert fallback.analysis.is_bug is True
+    assert len(fake_client.prompts) == 2
+
+
+def test_fused_response_in_code_fence_is_used_directly(fake_client):
+    fake_client.responses = ["```json\n" + _fused_response() + "\n```"]
+
+    result = BugAnalyserAgent().process_and_analyze_log("ERROR Database connection failed")
+
+    assert [_agent_of(prompt) for prompt in fake_client.prompts] == ["log_analyser"]
+    assert result.analysis.severity == BugSeverity.HIGH
+    assert result.analysis.category == BugCategory.DATABASE_ERROR
+    assert result.analysis.decision == AnalysisDecision.CREATE_ISSUE
+    assert result.log.message == "Database connection failed"
+
+
+def test_fused_invalid_log_is_not_analysed(fake_client):
+    fake_client.responses = [json.dumps({"is_valid": False, "validation_errors": ["not a log line"]})]
+
+    result = BugAnalyserAgent().process_and_analyze_log("hello")
+
+    assert len(fake_client.prompts) == 1
+    assert result.analysis.is_bug is False
+    assert result.analysis.analysis_notes == "Log processing failed: not a log line"
+    assert result.log.level == LogLevel.ERROR
+    assert result.log.additional_data == {"raw_input": "hello"}
+
+
+def test_fused_response_without_bug_analysis_runs_bug_analyser(fake_client):
+    fake_client.responses = [_fused_response(bug_analysis=None), json.dumps(BUG_ANALYSIS)]
+
+    result = BugAnalyserAgent().process_and_analyze_log("ERROR Database connection failed")
+
+    assert [_agent_of(prompt) for prompt in fake_client.prompts] == ["log_analyser", "bug_analyser"]
+    assert result.analysis.is_bug is True
+
+
+def test_fused_enum_values_fall_back_to_defaults(fake_client):
+    fake_client.responses = [_fused_response(bug_analysis={
+        "is_bug": True,
+        "severity": "HIGH",
+        "category": "cpu",
+        "impact": None,
+        "decision": 42,
+    })]
+
+    analysis = BugAnalyserAgent().process_and_analyze_log("ERROR boom").analysis
+
+    assert analysis.severity == BugSeverity.HIGH
+    assert analysis.category == BugCategory.OTHER
+    assert analysis.impact == BugImpact.LOW_IMPACT
+    assert analysis.decision == AnalysisDecision.IGNORE
+
+
+@pytest.mark.parametrize("malformed", ["not json at all", "```json\n{\"is_valid\": tru\n```", "[1, 2, 3]"])
+def test_malformed_fused_response_falls_back_to_two_steps(fake_client, malformed):
+    fake_client.responses = [
+        malformed,
+        json.dumps({"is_valid": True, "parsed_log": {"level": "ERROR", "message": "boom"}}),
+        json.dumps(BUG_ANALYSIS),
+    ]
+
+    result = BugAnalyserAgent().process_and_analyze_log("ERROR boom")
+
+    assert [_agent_of(prompt) for prompt in fake_client.prompts] == ["log_analyser", "log_receiver", "bug_analyser"]
+    assert result.log.message == "boom"
+    assert result.analysis.is_bug is True
+
+
+def test_fused_analysis_can_be_disabled(fake_client, monkeypatch):
+    monkeypatch.setenv("ENABLE_FUSED_ANALYSIS", "false")
+    reload_settings()
+    fake_client.responses = [
+        json.dumps({"is_valid": True, "parsed_log": {"level": "ERROR", "message": "boom"}}),
+        json.dumps(BUG_ANALYSIS),
+    ]
+
+    BugAnalyserAgent().process_and_analyze_log("ERROR boom")
+
+    assert [_agent_of(prompt) for prompt in fake_client.prompts] == ["log_receiver", "bug_analyser"]
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from src.agents.bug_finder_system import BugFinderSystem
+
+
+@pytest.fixture
+def system(fake_client, monkeypatch):
+    # O ADK lê a chave de GOOGLE_API_KEY; BugFinderSystem a define se ausente
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    bug_finder = BugFinderSystem()
+    monkeypatch.setattr(bug_finder.issue_manager.github_tool, "test_connection", lambda: True)
+    monkeypatch.setattr(bug_finder.notification_agent, "send_test_notification", lambda: True)
+    return bug_finder
+
+
+def test_integration_check_calls_the_model_every_time(system, fake_client):
+    fake_client.respond = lambda prompt: json.dumps({
+        "is_valid": True,
+        "parsed_log": {"level": "INFO", "message": "Test log message"},
+        "bug_analysis": {"is_bug": False},
+    })
+
+    first = system.test_integrations()
+    second = system.test_integrations()
+
+    assert first["overall"]["status"] == second["overall"]["status"] == "success"
+    # A segunda verificação não pode ser respondida pelo cache de análises
+    assert len(fake_client.prompts) == 2
+    assert len(system.bug_analyser.analysis_cache) == 0
@@ -0,0 +1,36 @@
+import pytest
+
+from src.config import AGENT_PROMPTS, get_prompt, validate_prompt_parameters
+from src.config.prompts import _parse_template
+
+
+def _sample_params(agent_name: str) -> dict:
+    return {name: f"<{name} value with {{braces}}>" for name in validate_prompt_parameters(agent_name)}
+
+
+@pytest.mark.parametrize("agent_name", sorted(AGENT_PROMPTS))
+def test_get_prompt_matches_str_format(agent_name):
+    template = AGENT_PROMPTS[agent_name]
+    params = _sample_params(agent_name)
+
+    try:
+        expected = template.format(**params)
+    except KeyError:
+        # Template que o str.format não consegue montar: get_prompt também deve falhar
+        with pytest.raises(ValueError):
+            get_prompt(agent_name, **params)
+        return
+
+    # Templates simples usam os segmentos pré-parseados, não o fallback do str.format
+    assert _parse_template(template) is not None
+    assert get_prompt(agent_name, **params) == expected
+
+
+def test_get_prompt_reports_missing_parameter():
+    with pytest.raises(ValueError, match="raw_log"):
+        get_prompt("log_receiver")
+
+
+def test_get_prompt_rejects_unknown_agent():
+    with pytest.raises(ValueError):
+        get_prompt("unknown_agent")
@@ -0,0 +1,25 @@
+import os
+
+from src.config import settings
+
+
+def test_load_environment_reads_dotenv_when_api_key_is_exported(tmp_path, monkeypatch):
+    dotenv = tmp_path / ".env"
+    dotenv.write_text(
+        "GOOGLE_AI_API_KEY=from-dotenv\n"
+        "DISCORD_WEBHOOK_URL=https://discord.test/webhook\n"
+    )
+    monkeypatch.setattr(settings, "DOTENV_PATH", dotenv)
+    monkeypatch.setenv("GOOGLE_AI_API_KEY", "exported")
+    monkeypatch.delenv("DISCORD_WEBHOOK_URL", raising=False)
+
+    try:
+        settings.load_environment()
+        loaded = settings.reload_settings()
+    finally:
+        # load_dotenv escreve direto em os.environ, fora do monkeypatch
+        os.environ.pop("DISCORD_WEBHOOK_URL", None)
+
+    # Variáveis exportadas têm precedência; as demais vêm do .env
+    assert loaded.google_ai_api_key == "exported"
+    assert loaded.discord_webhook_url == "https://discord.test/webhook"